@@ -1,21 +1,27 @@
-from aiogram.enums import ContentType
+from collections.abc import Mapping
+
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.input import MessageInput
 from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Column, Row
-from aiogram_dialog.widgets.text import Const, Format
+from aiogram_dialog.widgets.text import Const
 from loguru import logger
 from pydantic import ValidationError
 
+from src.bot.dialogs.widgets import CachedFormat, text_input_window
 from src.bot.handlers.admin_menu import back_to_admin_menu
-from src.bot.handlers.utils import reject_non_text, skip_optional_field
+from src.bot.handlers.utils import skip_optional_field
 from src.core_settings import bot
-from src.database import db
-from src.services.admin.manual_registration.models import ManualUserRegistrationData
 from src.services.admin.manual_registration.service import ValidateManualRegistrationService
 from src.services.admin.states import AddUserStatesGroup
 from src.services.admin.users_managment import AdminUserManagementService
 from src.services.admin.users_managment.models import RegisteredUserRole
+from src.services.user_registration.models import RegistrationData
+
+_ROLE_MAP: Mapping[str, str] = {
+    "role_colleague": RegisteredUserRole.COLLEAGUE.value,
+    "role_designer": RegisteredUserRole.DESIGNER.value,
+    "role_undefined": RegisteredUserRole.UNDEFINED.value,
+}
 
 
 class AddUserFieldHandler:
@@ -40,37 +46,27 @@ class AddUserFieldHandler:
             return
 
         dialog_manager.dialog_data[self.field_name] = result.cleaned_value
-        logger.debug(f"📝 Add user field '{self.field_name}' saved: {result.cleaned_value}")
+        logger.debug("📝 Add user field '{}' saved: {}", self.field_name, result.cleaned_value)
         await dialog_manager.next()
 
 
-async def on_role_selection(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
-    """Handle role selection."""
-    role_map = {
-        "role_colleague": RegisteredUserRole.COLLEAGUE.value,
-        "role_designer": RegisteredUserRole.DESIGNER.value,
-        "role_undefined": RegisteredUserRole.UNDEFINED.value,
-    }
-    role = role_map.get(button.widget_id, RegisteredUserRole.UNDEFINED.value)
-    dialog_manager.dialog_data["role"] = role
-    await dialog_manager.next()
-
-
 async def confirm_add_user(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
     """Confirm and add user."""
     try:
         data = dialog_manager.dialog_data
 
         try:
-            manual_registration_data = ManualUserRegistrationData(
-                telegram_id=int(data["telegram_id"]),
-                username=data.get("username", None),
-                first_name=data.get("first_name", None),
-                last_name=data.get("last_name", "Не заполнено"),
-                email=data.get("email", "Не заполнено"),
-                from_whom="Добавлен администратором",
+            # Fields were validated one by one on input, so only the strict model runs here
+            strict = RegistrationData.model_validate(
+                {
+                    "telegram_id": data["telegram_id"],
+                    "username": data.get("username"),
+                    "first_name": data.get("first_name"),
+                    "last_name": data.get("last_name") or "Не заполнено",
+                    "email": data.get("email") or "example@example.net",
+                    "from_whom": "Добавлен администратором",
+                }
             )
-            strict = manual_registration_data.to_strict_registration()
 
         except ValidationError as e:
             error_messages = [f"• {err['loc'][-1]}: {err['msg']}" for err in e.errors()]
@@ -78,51 +74,50 @@ async def confirm_add_user(callback: CallbackQuery, button: Button, dialog_manag
             await callback.message.answer("❌ Ошибки валидации:\n" + "\n".join(error_messages))
             return
 
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            success, message = await service.add_user_manually(
-                telegram_id=strict.telegram_id,
-                username=strict.username,
-                first_name=strict.first_name,
-                last_name=strict.last_name,
-                email=strict.email,
-                role=data["role"],
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        success, message = await service.add_user_manually(
+            telegram_id=strict.telegram_id,
+            username=strict.username,
+            first_name=strict.first_name,
+            last_name=strict.last_name,
+            email=strict.email,
+            role=data["role"],
+        )
+        if success:
+            await callback.message.answer(f"✅ {message}")
+            logger.info(
+                "✅ Admin {} manually added user {}", callback.from_user.id, strict.telegram_id
             )
-            if success:
-                await callback.message.answer(f"✅ {message}")
-                logger.info(
-                    f"✅ Admin {callback.from_user.id} manually added user {strict.telegram_id}"
-                )
-            else:
-                await callback.message.answer(f"❌ {message}")
+        else:
+            await callback.message.answer(f"❌ {message}")
 
-            await dialog_manager.done()
+        await dialog_manager.done()
 
     except Exception as e:
-        logger.error(f"❌ Error adding user manually: {e}")
+        logger.error("❌ Error adding user manually: {}", e)
         await callback.message.answer("❌ Ошибка добавления пользователя")
         await dialog_manager.done()
 
 
 async def add_user_data_getter(dialog_manager: DialogManager, **kwargs):
     """Get add user dialog data for display."""
-    data = dialog_manager.dialog_data.copy()
-    data["username"] = data.get("username") or "не указан"
-    data["last_name"] = data.get("last_name") or "не указана"
-    data["email"] = data.get("email") or "не указан"
-    return {"dialog_data": data}
+    data = dialog_manager.dialog_data
+    return {
+        "dialog_data": {
+            **data,
+            "username": data.get("username") or "не указан",
+            "last_name": data.get("last_name") or "не указана",
+            "email": data.get("email") or "не указан",
+        }
+    }
 
 
 async def on_role_selected(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
     """Handle user selection role."""
-
-    role_map = {
-        "role_colleague": RegisteredUserRole.COLLEAGUE.value,
-        "role_designer": RegisteredUserRole.DESIGNER.value,
-        "role_undefined": RegisteredUserRole.UNDEFINED.value,
-    }
-    role = role_map.get(button.widget_id, RegisteredUserRole.UNDEFINED.value)
-    dialog_manager.dialog_data["role"] = role
+    dialog_manager.dialog_data["role"] = _ROLE_MAP.get(
+        button.widget_id, RegisteredUserRole.UNDEFINED.value
+    )
     await dialog_manager.next()
 
 
@@ -133,63 +128,47 @@ last_name_handler = AddUserFieldHandler("last_name", optional=True)
 email_handler = AddUserFieldHandler("email", optional=True)
 
 
-telegram_id_window = Window(
-    Const("🆔 <b>Добавление пользователя</b>\n\nВведите Telegram ID пользователя:"),
-    MessageInput(telegram_id_handler, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Button(
-        text=Const("🔙 Вернуться в меню"),
-        id="admin_main_menu",
-        on_click=back_to_admin_menu,
+telegram_id_window = text_input_window(
+    "🆔 <b>Добавление пользователя</b>\n\nВведите Telegram ID пользователя:",
+    telegram_id_handler,
+    AddUserStatesGroup.telegram_id,
+    buttons=(
+        Button(
+            text=Const("🔙 Вернуться в меню"),
+            id="admin_main_menu",
+            on_click=back_to_admin_menu,
+        ),
     ),
-    state=AddUserStatesGroup.telegram_id,
 )
 
-username_window = Window(
-    Const("📝 Введите username пользователя (или пропустите):"),
-    MessageInput(username_handler, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Row(
-        Button(Const("⏭️ Пропустить"), id="skip_username", on_click=skip_optional_field),
-        Back(Const("⬅️ Назад")),
-        Cancel(Const("❌ Отмена")),
-    ),
-    state=AddUserStatesGroup.username,
+username_window = text_input_window(
+    "📝 Введите username пользователя (или пропустите):",
+    username_handler,
+    AddUserStatesGroup.username,
+    skip_id="skip_username",
+    on_skip=skip_optional_field,
 )
 
-first_name_window = Window(
-    Const("👤 Введите имя пользователя:"),
-    MessageInput(first_name_handler, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Row(
-        Back(Const("⬅️ Назад")),
-        Cancel(Const("❌ Отмена")),
-    ),
-    state=AddUserStatesGroup.first_name,
+first_name_window = text_input_window(
+    "👤 Введите имя пользователя:",
+    first_name_handler,
+    AddUserStatesGroup.first_name,
 )
 
-last_name_window = Window(
-    Const("👤 Введите фамилию пользователя (или пропустите):"),
-    MessageInput(last_name_handler, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Row(
-        Button(Const("⏭️ Пропустить"), id="skip_last_name", on_click=skip_optional_field),
-        Back(Const("⬅️ Назад")),
-        Cancel(Const("❌ Отмена")),
-    ),
-    state=AddUserStatesGroup.last_name,
+last_name_window = text_input_window(
+    "👤 Введите фамилию пользователя (или пропустите):",
+    last_name_handler,
+    AddUserStatesGroup.last_name,
+    skip_id="skip_last_name",
+    on_skip=skip_optional_field,
 )
 
-email_window = Window(
-    Const("📧 Введите email пользователя (или пропустите):"),
-    MessageInput(email_handler, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Row(
-        Button(Const("⏭️ Пропустить"), id="skip_email", on_click=skip_optional_field),
-        Back(Const("⬅️ Назад")),
-        Cancel(Const("❌ Отмена")),
-    ),
-    state=AddUserStatesGroup.email,
+email_window = text_input_window(
+    "📧 Введите email пользователя (или пропустите):",
+    email_handler,
+    AddUserStatesGroup.email,
+    skip_id="skip_email",
+    on_skip=skip_optional_field,
 )
 
 role_window = Window(
@@ -207,7 +186,7 @@ role_window = Window(
 )
 
 confirmation_window = Window(
-    Format(
+    CachedFormat(
         "📋 <b>Подтвердите добавление пользователя:</b>\n\n"
         "🆔 <b>ID:</b> <code>{dialog_data[telegram_id]}</code>\n"
         "📝 <b>Username:</b> @{dialog_data[username]}\n"
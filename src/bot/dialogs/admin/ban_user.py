@@ -1,15 +1,13 @@
-from aiogram.enums import ContentType
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.input import MessageInput
 from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Column, Row, Select
 from aiogram_dialog.widgets.text import Const, Format
 from loguru import logger
 
+from src.bot.dialogs.widgets import CachedFormat, text_input_window
 from src.bot.handlers.admin_menu import back_to_admin_menu
-from src.bot.handlers.utils import reject_non_text
 from src.core_settings import bot
-from src.database import db
+from src.database.models import RegisteredUser
 from src.services.admin.states import BanUserStatesGroup
 from src.services.admin.users_managment import AdminUserManagementService
 
@@ -31,55 +29,57 @@ async def confirm_ban_user(callback: CallbackQuery, button: Button, dialog_manag
     """Confirm and ban user."""
     try:
         data = dialog_manager.dialog_data
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            success, message = await service.ban_user(
-                telegram_id=data["telegram_id"], reason=data.get("reason")
-            )
-            if success:
-                await callback.message.answer(f"🚫 {message}")
-                logger.info(f"🚫 Admin {callback.from_user.id} banned user {data['telegram_id']}")
-            else:
-                await callback.message.answer(f"❌ {message}")
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        success, message = await service.ban_user(
+            telegram_id=data["telegram_id"], reason=data.get("reason")
+        )
+        if success:
+            await callback.message.answer(f"🚫 {message}")
+            logger.info("🚫 Admin {} banned user {}", callback.from_user.id, data["telegram_id"])
+        else:
+            await callback.message.answer(f"❌ {message}")
         await dialog_manager.done()
         await back_to_admin_menu(callback, button, dialog_manager)
 
     except Exception as e:
-        logger.error(f"❌ Error banning user: {e}")
+        logger.error("❌ Error banning user: {}", e)
         await callback.message.answer("❌ Ошибка блокировки пользователя")
         await dialog_manager.done()
 
 
+def _format_user_display(user: RegisteredUser) -> str:
+    """Build the user line shown on the ban confirmation window."""
+    return f"{user.first_name} {user.last_name or ''} {user.username or ''}".strip()
+
+
 async def on_user_selected_for_ban(
     callback: CallbackQuery, widget, dialog_manager: DialogManager, item_id: str
 ):
     """Handle user selection for banning."""
-    telegram_id = int(item_id.split("_")[1])
+    telegram_id = int(item_id)
     dialog_manager.dialog_data["telegram_id"] = telegram_id
-    try:
-        async with db.get_session() as session:
+
+    user_data_to_show = dialog_manager.dialog_data.get("_user_display_cache", {}).get(item_id)
+    if user_data_to_show is None:
+        try:
+            session = dialog_manager.middleware_data["db_session"]
             service = AdminUserManagementService(session, bot)
             chosen_user = await service.user_dao.get_registered_user_by_id(telegram_id)
-        if chosen_user:
-            user_data = [
-                chosen_user.first_name,
-                chosen_user.last_name if chosen_user.last_name else "",
-                chosen_user.username if chosen_user.username else "",
-            ]
-            user_data_to_show = " ".join(user_data)
-            dialog_manager.dialog_data["user_data"] = user_data_to_show
-    except Exception as e:
-        logger.warning(f"Selected user with id {telegram_id} not found: {e}")
-        dialog_manager.dialog_data["user_display"] = None
+            if chosen_user:
+                user_data_to_show = _format_user_display(chosen_user)
+        except Exception as e:
+            logger.warning("Selected user with id {} not found: {}", telegram_id, e)
+    # Without a name to show, the confirmation still identifies the user by id
+    dialog_manager.dialog_data["user_data"] = user_data_to_show or str(telegram_id)
 
     await dialog_manager.switch_to(BanUserStatesGroup.reason)
 
 
 async def ban_user_data_getter(dialog_manager: DialogManager, **kwargs):
     """Get ban user dialog data."""
-    data = dialog_manager.dialog_data.copy()
-    data["reason"] = data.get("reason") or "не указана"
-    return {"dialog_data": data}
+    data = dialog_manager.dialog_data
+    return {"dialog_data": {**data, "reason": data.get("reason") or "не указана"}}
 
 
 async def get_registered_users_data(dialog_manager: DialogManager, **kwargs) -> dict:
@@ -88,46 +88,49 @@ async def get_registered_users_data(dialog_manager: DialogManager, **kwargs) ->
         search_query = dialog_manager.dialog_data.get("search_query", "")
         current_page = dialog_manager.dialog_data.get("current_page", 0)
 
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            if search_query:
-                users, total_count, total_pages = await service.search_registered_users(
-                    search_query, page=current_page
-                )
-            else:
-                users, total_count, total_pages = await service.get_all_registered_users_paginated(
-                    page=current_page
-                )
-            if total_count > 0:
-                return {
-                    "users": users,
-                    "has_users": total_count > 0,
-                    "current_page": current_page,
-                    "total_pages": total_pages,
-                    "users_count": total_count,
-                    "has_prev": current_page > 0,
-                    "has_next": current_page < total_pages - 1,
-                    "page_info": f"Страница {current_page + 1} из {total_pages}",
-                }
-            else:
-                await bot.send_message(
-                    chat_id=dialog_manager.event.from_user.id,
-                    text="Нету пользователь с такими данными, попробуй ещё раз",
-                )
-                await dialog_manager.switch_to(BanUserStatesGroup.user_list)
-                return {
-                    "users": users,
-                    "has_users": total_count > 0,
-                    "current_page": current_page,
-                    "total_pages": total_pages,
-                    "users_count": total_count,
-                    "has_prev": current_page > 0,
-                    "has_next": current_page < total_pages - 1,
-                    "page_info": f"Страница {current_page + 1} из {total_pages}",
-                }
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        if search_query:
+            users, total_count, total_pages = await service.search_registered_users(
+                search_query, page=current_page
+            )
+        else:
+            users, total_count, total_pages = await service.get_all_registered_users_paginated(
+                page=current_page
+            )
+        dialog_manager.dialog_data["_user_display_cache"] = {
+            str(user.telegram_id): _format_user_display(user) for user in users
+        }
+        if total_count > 0:
+            return {
+                "users": users,
+                "has_users": total_count > 0,
+                "current_page": current_page,
+                "total_pages": total_pages,
+                "users_count": total_count,
+                "has_prev": current_page > 0,
+                "has_next": current_page < total_pages - 1,
+                "page_info": f"Страница {current_page + 1} из {total_pages}",
+            }
+        else:
+            await bot.send_message(
+                chat_id=dialog_manager.event.from_user.id,
+                text="Нету пользователь с такими данными, попробуй ещё раз",
+            )
+            await dialog_manager.switch_to(BanUserStatesGroup.user_list)
+            return {
+                "users": users,
+                "has_users": total_count > 0,
+                "current_page": current_page,
+                "total_pages": total_pages,
+                "users_count": total_count,
+                "has_prev": current_page > 0,
+                "has_next": current_page < total_pages - 1,
+                "page_info": f"Страница {current_page + 1} из {total_pages}",
+            }
 
     except Exception as e:
-        logger.error(f"❌ Error getting users: {e}")
+        logger.error("❌ Error getting users: {}", e)
         return {"users": [], "has_users": False, "total_pages": 0}
 
 
@@ -170,12 +173,11 @@ user_search_window = Window(
     state=BanUserStatesGroup.user_search,
 )
 
-search_input_window = Window(
-    Const("🔍 <b>Поиск пользователя</b>\n\n" "Введите имя, фамилию, username или email:"),
-    MessageInput(on_search_input, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Back(Const("⬅️ Назад")),
-    state=BanUserStatesGroup.user_list,
+search_input_window = text_input_window(
+    "🔍 <b>Поиск пользователя</b>\n\nВведите имя, фамилию, username или email:",
+    on_search_input,
+    BanUserStatesGroup.user_list,
+    buttons=(Back(Const("⬅️ Назад")),),
 )
 
 user_selection_window = Window(
@@ -184,7 +186,7 @@ user_selection_window = Window(
         Select(
             Format("👤 {item.first_name} {item.last_name} (@{item.username})"),
             items="users",
-            item_id_getter=lambda item: f"user_{item.telegram_id}",
+            item_id_getter=lambda item: str(item.telegram_id),
             id="select_user_for_ban",
             on_click=on_user_selected_for_ban,
         ),
@@ -202,20 +204,16 @@ user_selection_window = Window(
     getter=get_registered_users_data,
 )
 
-reason_window = Window(
-    Const("📝 Введите причину блокировки (или пропустите):"),
-    MessageInput(on_ban_reason_input, content_types=[ContentType.TEXT]),
-    MessageInput(reject_non_text),
-    Row(
-        Button(Const("⏭️ Пропустить"), id="skip_ban_reason", on_click=skip_ban_reason),
-        Back(Const("⬅️ Назад")),
-        Cancel(Const("❌ Отмена")),
-    ),
-    state=BanUserStatesGroup.reason,
+reason_window = text_input_window(
+    "📝 Введите причину блокировки (или пропустите):",
+    on_ban_reason_input,
+    BanUserStatesGroup.reason,
+    skip_id="skip_ban_reason",
+    on_skip=skip_ban_reason,
 )
 
 confirmation_window = Window(
-    Format(
+    CachedFormat(
         "⚠️ <b>Подтвердите блокировку пользователя:</b>\n\n"
         "👤 <b>Пользователь:</b> {dialog_data[user_data]}\n"
         "📝 <b>Причина:</b> {dialog_data[reason]}\n\n"
@@ -1,3 +1,6 @@
+import time
+from collections.abc import Mapping
+
 from aiogram.enums import ContentType
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
@@ -7,30 +10,54 @@ from aiogram_dialog.widgets.kbd import Button, Column, Row, Select
 from aiogram_dialog.widgets.text import Const, Format
 from loguru import logger
 
+from src.bot.dialogs.widgets import CachedFormat
 from src.bot.handlers.admin_menu import back_to_admin_menu
 from src.bot.handlers.utils import reject_non_text
 from src.core_settings import bot
-from src.database import db
-from src.database.models import PendingUser
 from src.services.admin.states import PendingUsersStatesGroup
 from src.services.admin.users_managment import AdminUserManagementService
 from src.services.admin.users_managment.models import RegisteredUserRole
 
+_ROLE_MAP: Mapping[str, str] = {
+    "role_colleague": RegisteredUserRole.COLLEAGUE.value,
+    "role_designer": RegisteredUserRole.DESIGNER.value,
+    "role_undefined": RegisteredUserRole.UNDEFINED.value,
+}
+
+# Pending list is shared between the list and details windows; refetched after TTL seconds
+_PENDING_CACHE_TTL = 30
+
 
 async def pending_users_getter(dialog_manager: DialogManager, **kwargs) -> dict:
     """Get pending users data from a database."""
     try:
-        async with db.get_session() as session:
+        cache = dialog_manager.dialog_data.get("_pending_cache")
+        if cache and time.time() - cache["fetched_at"] < _PENDING_CACHE_TTL:
+            pending_users = cache["users"]
+        else:
+            session = dialog_manager.middleware_data["db_session"]
             service = AdminUserManagementService(session, bot)
-            pending_users = await service.get_pending_users()
-            return {
-                "pending_users": pending_users,
-                "has_pending_users": len(pending_users) > 0,
-                "pending_users_count": len(pending_users),
+            pending_users = [
+                {
+                    "telegram_id": user.telegram_id,
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                }
+                for user in await service.get_pending_users()
+            ]
+            dialog_manager.dialog_data["_pending_cache"] = {
+                "users": pending_users,
+                "fetched_at": time.time(),
             }
 
+        return {
+            "pending_users": pending_users,
+            "has_pending_users": len(pending_users) > 0,
+            "pending_users_count": len(pending_users),
+        }
+
     except Exception as e:
-        logger.error(f"❌ Error getting pending users: {e}")
+        logger.error("❌ Error getting pending users: {}", e)
         return {"pending_users": [], "has_pending_users": False, "pending_users_count": 0}
 
 
@@ -41,28 +68,25 @@ async def pending_users_details_getter(dialog_manager: DialogManager, **kwargs)
         if not selected_user_id:
             return {}
 
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            pending_users = await service.get_pending_users()
-            user: PendingUser = next(
-                (u for u in pending_users if u.telegram_id == selected_user_id), None
-            )
-            if not user:
-                return {}
-
-            return {
-                "user": user,  # TODO Do i need it?
-                "telegram_id": user.telegram_id,
-                "first_name": user.first_name,
-                "last_name": user.last_name or "не указана",
-                "email": user.email or "не указан",
-                "phone": user.phone or "не указан",
-                "username": user.username or "не указан",
-                "from_whom": user.from_whom,
-                "created_at": user.created_at.strftime("%d.%m.%Y %H:%M"),
-            }
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        user = await service.user_dao.get_pending_user_by_id(selected_user_id)
+        if not user:
+            return {}
+
+        return {
+            "user": user,  # TODO Do i need it?
+            "telegram_id": user.telegram_id,
+            "first_name": user.first_name,
+            "last_name": user.last_name or "не указана",
+            "email": user.email or "не указан",
+            "phone": user.phone or "не указан",
+            "username": user.username or "не указан",
+            "from_whom": user.from_whom,
+            "created_at": user.created_at_display,
+        }
     except Exception as e:
-        logger.error(f"❌ Error getting user details: {e}")
+        logger.error("❌ Error getting user details: {}", e)
         return {}
 
 
@@ -74,11 +98,11 @@ async def on_user_selected(
 ):
     """Handle user selection."""
     try:
-        telegram_id = int(item_id.split("_")[1])
+        telegram_id = int(item_id)
         dialog_manager.dialog_data["selected_user_id"] = telegram_id
         await dialog_manager.switch_to(PendingUsersStatesGroup.user_details)
     except Exception as e:
-        logger.error(f"❌ Error selecting user: {e}")
+        logger.error("❌ Error selecting user: {}", e)
         await callback.message.answer("❌ Ошибка выбора пользователя")
 
 
@@ -95,26 +119,22 @@ async def on_decline_user(callback: CallbackQuery, button: Button, dialog_manage
 async def on_role_selected(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
     """Handle user role selection."""
     try:
-        role_map = {
-            "role_colleague": RegisteredUserRole.COLLEAGUE.value,
-            "role_designer": RegisteredUserRole.DESIGNER.value,
-            "role_undefined": RegisteredUserRole.UNDEFINED.value,
-        }
-        role = role_map.get(button.widget_id, RegisteredUserRole.UNDEFINED.value)
+        role = _ROLE_MAP.get(button.widget_id, RegisteredUserRole.UNDEFINED.value)
         telegram_id = dialog_manager.dialog_data["selected_user_id"]
+        dialog_manager.dialog_data.pop("_pending_cache", None)
 
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            success, message = await service.approve_pending_user(telegram_id, role)
-            if success:
-                await callback.message.answer(f"✅ {message}")
-                logger.info(f"✅ Admin {callback.from_user.id} approved user {telegram_id}")
-            else:
-                await callback.message.answer(f"❌ {message}")
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        success, message = await service.approve_pending_user(telegram_id, role)
+        if success:
+            await callback.message.answer(f"✅ {message}")
+            logger.info("✅ Admin {} approved user {}", callback.from_user.id, telegram_id)
+        else:
+            await callback.message.answer(f"❌ {message}")
         await dialog_manager.done()
 
     except Exception as e:
-        logger.error(f"❌ Error approving user: {e}")
+        logger.error("❌ Error approving user: {}", e)
         await callback.message.answer("❌ Ошибка одобрения пользователя")
         await dialog_manager.done()
 
@@ -124,18 +144,19 @@ async def on_decline_reason_input(message: Message, _: Actionable, dialog_manage
     try:
         reason = message.text.strip() if message.text else None
         telegram_id = dialog_manager.dialog_data["selected_user_id"]
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            success, response_message = await service.reject_pending_user(telegram_id, reason)
-            if success:
-                await message.answer(f"❌ {response_message}")
-                logger.info(f"❌ Admin {message.from_user.id} declined user {telegram_id}")
-            else:
-                await message.answer(f"❌ {response_message}")
+        dialog_manager.dialog_data.pop("_pending_cache", None)
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        success, response_message = await service.reject_pending_user(telegram_id, reason)
+        if success:
+            await message.answer(f"❌ {response_message}")
+            logger.info("❌ Admin {} declined user {}", message.from_user.id, telegram_id)
+        else:
+            await message.answer(f"❌ {response_message}")
         await dialog_manager.done()
 
     except Exception as e:
-        logger.error(f"❌ Error declining user: {e}")
+        logger.error("❌ Error declining user: {}", e)
         await message.answer("❌ Ошика отклонения заявки")
         await dialog_manager.done()
 
@@ -146,18 +167,19 @@ async def skip_decline_reason(
     """Skip decline reasone and decline user."""
     try:
         telegram_id = dialog_manager.dialog_data["selected_user_id"]
-        async with db.get_session() as session:
-            service = AdminUserManagementService(session, bot)
-            success, message = await service.reject_pending_user(telegram_id, None)
-            if success:
-                await callback.message.answer(f"❌ {message}")
-                logger.info(f"❌ Admin {callback.from_user.id} declined user {telegram_id}")
-            else:
-                await callback.message.answer(f"❌ {message}")
+        dialog_manager.dialog_data.pop("_pending_cache", None)
+        session = dialog_manager.middleware_data["db_session"]
+        service = AdminUserManagementService(session, bot)
+        success, message = await service.reject_pending_user(telegram_id, None)
+        if success:
+            await callback.message.answer(f"❌ {message}")
+            logger.info("❌ Admin {} declined user {}", callback.from_user.id, telegram_id)
+        else:
+            await callback.message.answer(f"❌ {message}")
         await dialog_manager.done()
 
     except Exception as e:
-        logger.error(f"❌ Error declining user: {e}")
+        logger.error("❌ Error declining user: {}", e)
         await callback.message.answer("❌ Ошибка отклонения заявки")
         await dialog_manager.done()
 
@@ -166,9 +188,9 @@ users_list_window = Window(
     Const("⏳ <b>Заявки на регистрацию</b>\n\n"),
     Format("📊 Всего заявок: {pending_users_count}"),
     Select(
-        Format("👤 {item.first_name} {item.last_name} (ID: {item.telegram_id})"),
+        Format("👤 {item[first_name]} {item[last_name]} (ID: {item[telegram_id]})"),
         items="pending_users",
-        item_id_getter=lambda item: f"user_{item.telegram_id}",
+        item_id_getter=lambda item: str(item["telegram_id"]),
         id="select_pending_user",
         on_click=on_user_selected,
     ),
@@ -182,7 +204,7 @@ users_list_window = Window(
 )
 
 user_details_window = Window(
-    Format(
+    CachedFormat(
         "👤 <b>Данные пользователя:</b>\n\n"
         "🆔 <b>ID:</b> <code>{telegram_id}</code>\n"
         "👤 <b>Имя:</b> {first_name} {last_name}\n"
@@ -1,3 +1,4 @@
+import asyncio
 import operator
 from typing import Any, Dict
 
@@ -13,135 +14,153 @@ from src.services.carpet_search.models import CarpetFilters
 from src.services.carpet_search.service import CarpetSearchService
 from src.services.carpet_search.states import CarpetSearchStatesGroup
 
+_EMPTY_FILTERS_DUMP = CarpetFilters().model_dump()
 
-async def on_filter_selected(
-    callback: CallbackQuery, button: Button, dialog_manager: DialogManager
-):
-    """Handle filter button click - navigate to filter selection window."""
-    try:
-        # Extract filter type from button id (e.g., "filter_geometry" -> "geometry")
-        filter_type = button.widget_id.replace("filter_", "")
-        dialog_manager.dialog_data["current_filter_type"] = filter_type
-        state_map = {
-            "geometry": CarpetSearchStatesGroup.geometry_selection,
-            "size": CarpetSearchStatesGroup.size_selection,
-            "color": CarpetSearchStatesGroup.color_selection,
-            "style": CarpetSearchStatesGroup.style_selection,
-            "collection": CarpetSearchStatesGroup.collection_selection,
-        }
+FILTER_TYPES = ("geometry", "size", "color", "style", "collection")
+_STATE_MAP = {
+    filter_type: getattr(CarpetSearchStatesGroup, f"{filter_type}_selection")
+    for filter_type in FILTER_TYPES
+}
+# Multiselect widget of each filter window, filled by create_filter_window
+_MULTISELECTS: Dict[str, Multiselect] = {}
 
-        target_state = state_map.get(filter_type)
-        if target_state:
-            await dialog_manager.switch_to(target_state)
-            logger.info(f"🔍 User {callback.from_user.id} opened {filter_type} filter")
-        else:
-            logger.error(f"❌ Unknown filter type: {filter_type}")
-            await callback.answer("❌ Неизвестный тип фильтра")
+# Running prefetches by filters cache key; holds strong task references until they finish
+_prefetch_tasks: Dict[tuple, asyncio.Task] = {}
 
-    except Exception as e:
-        logger.error(f"❌ Error in on_filter_selected: {e}")
-        await callback.answer("❌ Ошибка открытия фильтра")
 
+def _get_filters(dialog_manager: DialogManager) -> CarpetFilters:
+    """Get current filters parsed from dialog_data["filters"].
 
-async def on_apply_filter(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
-    """Apply selected filter values and return to main menu."""
-    try:
-        filter_type = dialog_manager.dialog_data.get("current_filter_type")
-        if not filter_type:
-            await callback.answer("❌ Тип фильтра не определен")
-            return
-
-        # Get selected values from multiselect widget
-        multiselect_id = f"{filter_type}_multiselect"
-        widget = dialog_manager.find(multiselect_id)
-        if not widget:
-            logger.error(f"❌ Multiselect widget not found: {multiselect_id}")
-            await callback.answer("❌ Ошибка применения фильтра")
-            return
-
-        selected_ids = widget.get_checked()
-
-        # Convert short IDs back to actual values using the mapping
-        value_mapping = dialog_manager.dialog_data.get(f"{filter_type}_value_mapping", {})
-        selected_values = [
-            value_mapping.get(id_str) for id_str in selected_ids if id_str in value_mapping
-        ]
+    Only the serialized dict lives in dialog data, which FSM storage persists; each call
+    returns a fresh model, so callers may mutate it and store it back with _save_filters.
+    """
+    return CarpetFilters(**dialog_manager.dialog_data.get("filters", {}))
 
-        # Update filters in dialog data
-        filters_data = dialog_manager.dialog_data.get("filters", {})
-        current_filters = CarpetFilters(**filters_data)
 
-        # Update the specific filter type with selected values
-        setattr(current_filters, filter_type, selected_values)
+def _save_filters(dialog_manager: DialogManager, current_filters: CarpetFilters) -> None:
+    """Store mutated filters in dialog data in their serialized form."""
+    dialog_manager.dialog_data["filters"] = current_filters.model_dump()
 
-        # Save updated filters back to dialog data
-        dialog_manager.dialog_data["filters"] = current_filters.model_dump()
-        logger.info(
-            f"✅ User {callback.from_user.id} applied {filter_type} filter: {selected_values}"
-        )
 
-        # Navigate back to main menu
-        await dialog_manager.switch_to(CarpetSearchStatesGroup.main_menu)
-        await callback.answer("✅ Фильтр применен")
+async def on_filter_selected(
+    callback: CallbackQuery, button: Button, dialog_manager: DialogManager
+):
+    """Handle filter button click - navigate to filter selection window."""
+    # Extract filter type from button id (e.g., "filter_geometry" -> "geometry")
+    filter_type = button.widget_id.replace("filter_", "")
+    dialog_manager.dialog_data["current_filter_type"] = filter_type
+    # Ask the getter to sync the checkboxes with the applied filter on first render
+    dialog_manager.dialog_data["_sync_checked"] = True
 
-    except Exception as e:
-        logger.error(f"❌ Error in on_apply_filter: {e}")
+    target_state = _STATE_MAP.get(filter_type)
+    if target_state:
+        await dialog_manager.switch_to(target_state)
+        logger.info("🔍 User {} opened {} filter", callback.from_user.id, filter_type)
+    else:
+        logger.error("❌ Unknown filter type: {}", filter_type)
+        await callback.answer("❌ Неизвестный тип фильтра")
+
+
+async def on_apply_filter(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
+    """Apply selected filter values and return to main menu."""
+    filter_type = dialog_manager.dialog_data.get("current_filter_type")
+    if not filter_type:
+        await callback.answer("❌ Тип фильтра не определен")
+        return
+
+    # Get selected values from multiselect widget
+    widget = _MULTISELECTS.get(filter_type)
+    if not widget:
+        logger.error("❌ Multiselect widget not found for filter: {}", filter_type)
         await callback.answer("❌ Ошибка применения фильтра")
+        return
+
+    selected_ids = widget.get_checked(dialog_manager)
+
+    # Short IDs are indexes into the option values stored by the getter
+    values = dialog_manager.dialog_data.pop("_filter_values", [])
+    selected_values = [
+        values[int(id_str)]
+        for id_str in selected_ids
+        if id_str.isdigit() and int(id_str) < len(values)
+    ]
+
+    # Update the specific filter type with selected values
+    current_filters = _get_filters(dialog_manager)
+    setattr(current_filters, filter_type, selected_values)
+
+    # Save updated filters back to dialog data
+    _save_filters(dialog_manager, current_filters)
+    logger.info(
+        "✅ User {} applied {} filter: {}", callback.from_user.id, filter_type, selected_values
+    )
+
+    # Navigate back to main menu
+    await dialog_manager.switch_to(CarpetSearchStatesGroup.main_menu)
+    await callback.answer("✅ Фильтр применен")
 
 
 async def on_clear_filter(callback: CallbackQuery, button: Button, dialog_manager: DialogManager):
     """Clear current filter and reload options."""
-    try:
-        filter_type = dialog_manager.dialog_data.get("current_filter_type")
-        if not filter_type:
-            await callback.answer("❌ Тип фильтра не определен")
-            return
+    filter_type = dialog_manager.dialog_data.get("current_filter_type")
+    if not filter_type:
+        await callback.answer("❌ Тип фильтра не определен")
+        return
 
-        # Clear the specific filter
-        filters_data = dialog_manager.dialog_data.get("filters", {})
-        current_filters = CarpetFilters(**filters_data)
-        current_filters.clear_filter(filter_type)
+    # Clear the specific filter
+    current_filters = _get_filters(dialog_manager)
+    current_filters.clear_filter(filter_type)
 
-        # Save updated filters
-        dialog_manager.dialog_data["filters"] = current_filters.model_dump()
+    # Save updated filters and uncheck the boxes on the next render
+    _save_filters(dialog_manager, current_filters)
+    dialog_manager.dialog_data["_sync_checked"] = True
 
-        logger.info(f"🗑 User {callback.from_user.id} cleared {filter_type} filter")
+    logger.info("🗑 User {} cleared {} filter", callback.from_user.id, filter_type)
 
-        # Reload the current window to reflect changes
-        await callback.answer("🗑 Фильтр очищен")
-
-    except Exception as e:
-        logger.error(f"❌ Error in on_clear_filter: {e}")
-        await callback.answer("❌ Ошибка очистки фильтра")
+    # Reload the current window to reflect changes
+    await callback.answer("🗑 Фильтр очищен")
 
 
 async def on_clear_all_filters(
     callback: CallbackQuery, button: Button, dialog_manager: DialogManager
 ):
     """Clear all filters and return to initial state."""
-    try:
-        # Reset filters to empty state
-        dialog_manager.dialog_data["filters"] = CarpetFilters().model_dump()
+    # Reset filters to empty state
+    dialog_manager.dialog_data["filters"] = {field: [] for field in _EMPTY_FILTERS_DUMP}
 
-        logger.info(f"🗑 User {callback.from_user.id} cleared all filters")
+    logger.info("🗑 User {} cleared all filters", callback.from_user.id)
 
-        await callback.answer("🗑 Все фильтры очищены")
+    await callback.answer("🗑 Все фильтры очищены")
 
-    except Exception as e:
-        logger.error(f"❌ Error in on_clear_all_filters: {e}")
-        await callback.answer("❌ Ошибка очистки фильтров")
+
+async def _prefetch_filter_options(current_filters: CarpetFilters) -> None:
+    """Warm the filter options cache for every filter type."""
+    async with db.get_session() as session:
+        await CarpetSearchService(session).prefetch_filter_options(current_filters)
+
+
+def _schedule_prefetch(current_filters: CarpetFilters) -> None:
+    """Start a background prefetch unless the options are cached or already being loaded."""
+    key = current_filters.cache_key()
+    if key in _prefetch_tasks or CarpetSearchService.has_cached_filter_options(current_filters):
+        return
+    task = asyncio.create_task(_prefetch_filter_options(current_filters))
+    _prefetch_tasks[key] = task
+    task.add_done_callback(lambda _: _prefetch_tasks.pop(key, None))
 
 
 async def main_menu_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str, Any]:
     """Get data for main menu window."""
     try:
         # Get current filters from dialog data
-        filters_data = dialog_manager.dialog_data.get("filters", {})
-        current_filters = CarpetFilters(**filters_data)
+        current_filters = _get_filters(dialog_manager)
 
-        async with db.get_session() as session:
-            service = CarpetSearchService(session)
-            total_carpets = await service.count_filtered_carpets(current_filters)
+        session = dialog_manager.middleware_data["db_session"]
+        service = CarpetSearchService(session)
+        total_carpets = await service.count_filtered_carpets(current_filters)
+
+        # The next click is almost always a filter button, so load its options meanwhile
+        _schedule_prefetch(current_filters)
 
         return {
             "main_menu_text": messages.get_main_menu_text(current_filters, total_carpets),
@@ -151,7 +170,7 @@ async def main_menu_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str,
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in main_menu_getter: {e}")
+        logger.error("❌ Error in main_menu_getter: {}", e)
         return {
             "main_menu_text": f"{messages.welcome_title}\n\n{messages.error_loading_filters}",
             "has_filters": False,
@@ -174,44 +193,51 @@ async def filter_selection_getter(dialog_manager: DialogManager, **kwargs) -> Di
             }
 
         # Get current filters
-        filters_data = dialog_manager.dialog_data.get("filters", {})
-        current_filters = CarpetFilters(**filters_data)
+        current_filters = _get_filters(dialog_manager)
 
-        async with db.get_session() as session:
-            service = CarpetSearchService(session)
-            filter_results = await service.get_filter_options(
-                filter_type=filter_type, current_filters=current_filters
-            )
+        async def fetch_options():
+            async with db.get_session() as session:
+                return await CarpetSearchService(session).get_filter_options(
+                    filter_type=filter_type, current_filters=current_filters
+                )
 
-        # Get currently selected values for this filter
-        current_selections = getattr(current_filters, filter_type, [])
+        async def fetch_count():
+            async with db.get_session() as session:
+                return await CarpetSearchService(session).count_filtered_carpets(current_filters)
 
-        # Store value mapping in dialog_data to avoid long callback data
-        value_mapping = {str(i): opt.value for i, opt in enumerate(filter_results.options)}
-        reverse_mapping = {opt.value: str(i) for i, opt in enumerate(filter_results.options)}
+        # An AsyncSession can't run statements concurrently, so each query gets its own
+        filter_results, total_carpets = await asyncio.gather(fetch_options(), fetch_count())
 
-        dialog_manager.dialog_data[f"{filter_type}_value_mapping"] = value_mapping
-        dialog_manager.dialog_data[f"{filter_type}_reverse_mapping"] = reverse_mapping
-
-        # Format options as tuples (display_text, short_id) with counts
-        options = [
-            (f"{opt.value} ({opt.count})", str(i)) for i, opt in enumerate(filter_results.options)
-        ]
+        # Get currently selected values for this filter
+        current_selections = getattr(current_filters, filter_type, [])
 
-        # Pre-select currently selected values using short IDs
-        multiselect_id = f"{filter_type}_multiselect"
-        widget = dialog_manager.find(multiselect_id)
-        if widget and current_selections:
-            selected_ids = [
-                reverse_mapping.get(val) for val in current_selections if val in reverse_mapping
-            ]
-            widget.set_checked(*selected_ids)
+        # Collect option values and (display_text, short_id) tuples in one pass
+        values, options = [], []
+        for i, opt in enumerate(filter_results.options):
+            values.append(opt.value)
+            options.append((f"{opt.value} ({opt.count})", str(i)))
+
+        # Store option values of the open filter only; callbacks carry just their index
+        dialog_manager.dialog_data["_filter_values"] = values
+
+        # Check applied values when the window opens; later renders keep the user's clicks
+        if dialog_manager.dialog_data.pop("_sync_checked", False):
+            selected_ids = []
+            if current_selections:
+                reverse_mapping = {value: str(i) for i, value in enumerate(values)}
+                selected_ids = [
+                    reverse_mapping[val] for val in current_selections if val in reverse_mapping
+                ]
+            _MULTISELECTS[filter_type].set_widget_data(dialog_manager, selected_ids)
 
         selected_count = len(current_selections)
         total_options = len(options)
 
         filter_text = messages.get_filter_selection_text(
-            filter_type=filter_type, selected_count=selected_count, total_options=total_options
+            filter_type=filter_type,
+            selected_count=selected_count,
+            total_options=total_options,
+            total_carpets=total_carpets,
         )
 
         return {
@@ -222,7 +248,7 @@ async def filter_selection_getter(dialog_manager: DialogManager, **kwargs) -> Di
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in filter_selection_getter: {e}")
+        logger.error("❌ Error in filter_selection_getter: {}", e)
         return {
             "filter_text": messages.error_loading_filters,
             "options": [],
@@ -235,13 +261,11 @@ async def results_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str, A
     """Get data for results window - display filtered carpets."""
     try:
         # Get current filters
-        filters_data = dialog_manager.dialog_data.get("filters", {})
-        current_filters = CarpetFilters(**filters_data)
+        current_filters = _get_filters(dialog_manager)
 
-        async with db.get_session() as session:
-            service = CarpetSearchService(session)
-            carpets = await service.search_carpets(current_filters=current_filters, limit=50)
-            total_count = await service.count_filtered_carpets(current_filters=current_filters)
+        session = dialog_manager.middleware_data["db_session"]
+        service = CarpetSearchService(session)
+        carpets, total_count = await service.search_with_count(current_filters, limit=50)
 
         if not carpets:
             return {
@@ -252,12 +276,10 @@ async def results_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str, A
             }
 
         # Format carpets for display
-        carpets_display_parts = []
-        for i, carpet in enumerate(carpets, 1):
-            carpet_text = messages.format_carpet_result(carpet)
-            carpets_display_parts.append(f"━━━━━━━━━━━━━━━\n{i}. {carpet_text}")
-
-        carpets_display = "\n\n".join(carpets_display_parts)
+        carpets_display = "\n\n".join(
+            f"{messages.result_separator}{i}. {messages.format_carpet_result(carpet)}"
+            for i, carpet in enumerate(carpets, 1)
+        )
         results_summary = messages.results_summary_format.format(count=total_count)
         results_text = f"{messages.results_title}\n\n{results_summary}\n"
 
@@ -269,7 +291,7 @@ async def results_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str, A
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in results_getter: {e}")
+        logger.error("❌ Error in results_getter: {}", e)
         return {
             "results_text": f"{messages.results_title}\n\n{messages.error_searching_carpets}",
             "carpets_display": "",
@@ -281,18 +303,17 @@ async def results_getter(dialog_manager: DialogManager, **kwargs) -> Dict[str, A
 # Create filter selection windows dynamically
 def create_filter_window(filter_type: str) -> Window:
     """Create a filter selection window for a specific filter type."""
+    multiselect = Multiselect(
+        Format("✅️ {item[0]}"),
+        Format("☐ {item[0]}"),
+        id=f"{filter_type}_multiselect",
+        item_id_getter=operator.itemgetter(1),
+        items="options",
+    )
+    _MULTISELECTS[filter_type] = multiselect
     return Window(
         Format("{filter_text}"),
-        Group(
-            Multiselect(
-                Format("✅️ {item[0]}"),
-                Format("☐ {item[0]}"),
-                id=f"{filter_type}_multiselect",
-                item_id_getter=operator.itemgetter(1),
-                items="options",
-            ),
-            width=2,
-        ),
+        Group(multiselect, width=2),
         Column(
             Button(
                 Const(messages.apply_and_back_button),
@@ -310,7 +331,7 @@ def create_filter_window(filter_type: str) -> Window:
             id="back_to_main",
             state=CarpetSearchStatesGroup.main_menu,
         ),
-        state=getattr(CarpetSearchStatesGroup, f"{filter_type}_selection"),
+        state=_STATE_MAP[filter_type],
         getter=filter_selection_getter,
     )
 
@@ -320,31 +341,14 @@ main_menu_window = Window(
     Format("{main_menu_text}"),
     # Filter buttons
     Column(
-        Button(
-            Const(messages.filter_titles["geometry"]),
-            id="filter_geometry",
-            on_click=on_filter_selected,
-        ),
-        Button(
-            Const(messages.filter_titles["size"]),
-            id="filter_size",
-            on_click=on_filter_selected,
-        ),
-        Button(
-            Const(messages.filter_titles["color"]),
-            id="filter_color",
-            on_click=on_filter_selected,
-        ),
-        Button(
-            Const(messages.filter_titles["style"]),
-            id="filter_style",
-            on_click=on_filter_selected,
-        ),
-        Button(
-            Const(messages.filter_titles["collection"]),
-            id="filter_collection",
-            on_click=on_filter_selected,
-        ),
+        *[
+            Button(
+                Const(messages.filter_titles[filter_type]),
+                id=f"filter_{filter_type}",
+                on_click=on_filter_selected,
+            )
+            for filter_type in FILTER_TYPES
+        ]
     ),
     # Action buttons
     Row(
@@ -12,8 +12,7 @@ from src.bot.handlers.registration import (
     save_registration_data,
     skip_phone_handler,
 )
-from src.bot.handlers.utils import data_getter, reject_non_text
-from src.database import db
+from src.bot.handlers.utils import reject_non_text
 from src.services.user_registration import RegistrationService, RegistrationStatesGroup, messages
 from src.services.user_registration.models import DialogStructure, DialogWindowData
 
@@ -24,20 +23,19 @@ registration_router = Router()
 async def start_registration_dialog(callback: CallbackQuery, dialog_manager: DialogManager):
     try:
         telegram_id = callback.from_user.id
-        logger.info(f"🚀 Starting registration for user {telegram_id}")
-        async with db.get_session() as session:
-            registration_service = RegistrationService(session)
-            exists, status_message = await registration_service.check_existing_user(telegram_id)
-            if exists:
-                await callback.message.answer(f"⚠️ {status_message}")
-                return
+        logger.info("🚀 Starting registration for user {}", telegram_id)
+        session = dialog_manager.middleware_data["db_session"]
+        exists, status_message = await RegistrationService(session).check_existing_user(telegram_id)
+        if exists:
+            await callback.message.answer(f"⚠️ {status_message}")
+            return
 
         await dialog_manager.start(
             state=RegistrationStatesGroup.first_name, mode=StartMode.RESET_STACK
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"❌ Error starting registration dialog for {telegram_id}: {e}")
+        logger.error("❌ Error starting registration dialog for {}: {}", telegram_id, e)
         await callback.message.answer("⚠️ Произошла ошибка при запуске регистрации")
         await callback.answer()
 
@@ -118,7 +116,6 @@ confirmation_window = Window(
         Cancel(Const(messages.cancel_button)),
     ),
     state=RegistrationStatesGroup.confirmation,
-    getter=data_getter,
 )
 
 registration_dialog = Dialog(*dialogs_windows, confirmation_window)
@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+from string import Formatter
+
+from aiogram.enums import ContentType
+from aiogram.fsm.state import State
+from aiogram_dialog import DialogManager, Window
+from aiogram_dialog.widgets.common import WhenCondition
+from aiogram_dialog.widgets.input import MessageHandlerFunc, MessageInput
+from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Keyboard, Row
+from aiogram_dialog.widgets.kbd.button import OnClick
+from aiogram_dialog.widgets.text import Const, Text
+
+from src.bot.handlers.utils import reject_non_text
+
+# Navigation widgets are stateless, so one instance is shared by every input window
+_BACK = Back(Const("⬅️ Назад"))
+_CANCEL = Cancel(Const("❌ Отмена"))
+_SKIP_TEXT = Const("⏭️ Пропустить")
+
+
+class CachedFormat(Text):
+    """Format-like text widget that parses its template once at import.
+
+    Supports plain ``{key}`` and indexed ``{key[item]}`` fields, which is all the
+    confirmation windows use. Format specs and conversions are not supported.
+    """
+
+    def __init__(self, text: str, when: WhenCondition = None):
+        super().__init__(when=when)
+        self.text = text
+        self._parts: list[tuple[str, tuple[str, ...]]] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(text):
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported format field in template: {field_name!r}")
+            if field_name is None:
+                self._parts.append((literal, ()))
+                continue
+            root, _, rest = field_name.partition("[")
+            keys = tuple(item.rstrip("]") for item in rest.split("[")) if rest else ()
+            self._parts.append((literal, (root, *keys)))
+
+    async def _render_text(self, data: dict, manager: DialogManager) -> str:
+        rendered = []
+        for literal, path in self._parts:
+            rendered.append(literal)
+            if path:
+                value = data
+                for key in path:
+                    value = value[key]
+                rendered.append(str(value))
+        return "".join(rendered)
+
+
+def text_input_window(
+    prompt: str,
+    handler: MessageHandlerFunc,
+    state: State,
+    *,
+    skip_id: str | None = None,
+    on_skip: OnClick | None = None,
+    buttons: Sequence[Keyboard] = (_BACK, _CANCEL),
+) -> Window:
+    """Build a window that asks for one text value and rejects other content types.
+
+    Args:
+        prompt: Text shown to the user
+        handler: Handler for the entered text
+        state: Dialog state of the window
+        skip_id: Widget id of the optional skip button
+        on_skip: Click handler of the skip button
+        buttons: Navigation buttons shown in the bottom row
+
+    Returns:
+        Configured dialog window
+    """
+    if skip_id:
+        buttons = (Button(_SKIP_TEXT, id=skip_id, on_click=on_skip), *buttons)
+    return Window(
+        Const(prompt),
+        MessageInput(handler, content_types=[ContentType.TEXT]),
+        MessageInput(reject_non_text),
+        Row(*buttons),
+        state=state,
+    )
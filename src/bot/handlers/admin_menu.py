@@ -1,8 +1,12 @@
 import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
 
 from aiogram import F, Router
+from aiogram.exceptions import TelegramAPIError
 from aiogram.filters import Command
-from aiogram.types import CallbackQuery, Message
+from aiogram.fsm.state import State
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 from aiogram_dialog import DialogManager, StartMode
 from aiogram_dialog.widgets.kbd import Button
 from loguru import logger
@@ -12,14 +16,54 @@ from src.core_settings import base_settings
 from src.database import db
 from src.services.admin import states
 from src.services.admin.messages import messages as admin_messages
+from src.services.carpet_search.service import invalidate_search_caches
+from src.services.google_sheets.base_service import BaseGoogleSheetsService, SyncResult
 from src.services.google_sheets.carpets_service import GoogleSheetsCarpetService
 from src.services.google_sheets.sales_service import GoogleSheetsSalesService
 
 admin_menu_router = Router()
 
+SYNC_ANIMATION_INTERVAL = 2.5
+SYNC_ANIMATION_MAX_EDITS = 10
+
+# Sync targets come from settings that do not change at runtime
+SPREADSHEET_ID = base_settings.GOOGLE_SPREADSHEET_ID
+CARPETS_SHEET_TITLE = base_settings.GOOGLE_CARPETS_SHEET_TITLE
+SALES_SHEET_TITLE = base_settings.GOOGLE_SALES_SHEET_TITLE
+
+AdminCallbackHandler = Callable[[CallbackQuery, DialogManager], Awaitable[None]]
+
+# Menu callback data -> (dialog start state, log message, user-facing error)
+_ADMIN_DIALOGS = {
+    "admin_pending_users": (
+        states.PendingUsersStatesGroup.users_list,
+        "📋 Pending users dialog started by admin",
+        "❌ Ошибка запуска диалога заявок",
+    ),
+    "admin_add_user": (
+        states.AddUserStatesGroup.telegram_id,
+        "➕ Add user dialog started by admin",
+        "❌ Ошибка запуска диалога добавления пользователя",
+    ),
+    "admin_ban_user": (
+        states.BanUserStatesGroup.user_search,
+        "🚫 Ban user dialog started by admin",
+        "❌ Ошибка запуска диалога блокировки пользователя",
+    ),
+    "admin_broadcast": (
+        states.BroadcastStatesGroup.message,
+        "📢 Broadcast dialog started by admin",
+        "❌ Ошибка запуска диалога рассылки",
+    ),
+}
+
 
 async def spinning_sync_animation(message):
-    """Show spinning animation with cycling status messages."""
+    """Show spinning animation with cycling status messages.
+
+    Telegram allows about one edit per second per chat, so the status changes every
+    SYNC_ANIMATION_INTERVAL seconds and stops after SYNC_ANIMATION_MAX_EDITS edits.
+    """
     statuses = [
         "🔄 Синхронизация",
         "🔄 Синхронизация.",
@@ -27,18 +71,25 @@ async def spinning_sync_animation(message):
         "🔄 Синхронизация...",
     ]
 
-    index = 0
+    edit_text = message.edit_text
     try:
-        while True:
-            await message.edit_text(text=statuses[index % len(statuses)])
-            await asyncio.sleep(0.5)
-            index += 1
+        for index in range(SYNC_ANIMATION_MAX_EDITS):
+            await edit_text(text=statuses[index % len(statuses)])
+            await asyncio.sleep(SYNC_ANIMATION_INTERVAL)
     except asyncio.CancelledError:
         pass
+    except TelegramAPIError as e:
+        # The animation is cosmetic; a failed edit must not fail the sync
+        logger.debug("⚠️ Sync animation stopped: {}", e)
 
 
 async def perform_sync_with_animation(
-    callback, service_class, sync_method, spreadsheet_id, worksheet_title, table_name
+    callback: CallbackQuery,
+    service_class: type[BaseGoogleSheetsService],
+    sync_method: Callable[..., Awaitable[SyncResult]],
+    spreadsheet_id: str,
+    worksheet_title: str,
+    table_name: str,
 ):
     """Perform Google Sheets sync with animation for any table."""
     try:
@@ -51,23 +102,22 @@ async def perform_sync_with_animation(
         async def perform_actual_sync():
             async with db.get_session() as session:
                 service = service_class(session=session)
-                sync_func = getattr(service, sync_method)
-                result = await sync_func(
+                result = await sync_method(
+                    service,
                     spreadsheet_id=spreadsheet_id,
                     worksheet_title=worksheet_title,
                 )
                 return result
 
         animation_task = asyncio.create_task(spinning_sync_animation(callback.message))
-        sync_task = asyncio.create_task(perform_actual_sync())
-        done, pending = await asyncio.wait([sync_task], return_when=asyncio.FIRST_COMPLETED)
-        animation_task.cancel()
         try:
-            await animation_task
-        except asyncio.CancelledError:
-            pass
+            result = await perform_actual_sync()
+        finally:
+            # Stop the animation even when the sync fails
+            animation_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await animation_task
 
-        result = await done.pop()
         if result.invalid_report:
             message_text = admin_messages.sync_completed_with_errors.format(
                 total_rows=result.total_rows,
@@ -89,20 +139,27 @@ async def perform_sync_with_animation(
             )
         await callback.message.edit_text(
             text=message_text,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
+            reply_markup=admin_messages.ADMIN_MENU_KEYBOARD,
         )
         logger.info(
-            f"✅ {table_name} sync completed by admin {callback.from_user.id}: "
-            f"total={result.total_rows}, inserted={result.inserted}, "
-            f"updated={result.updated}, deleted={result.deleted}, skipped={result.skipped}, bad_data={result.bad_data}"
+            "✅ {} sync completed by admin {}: total={}, inserted={}, "
+            "updated={}, deleted={}, skipped={}, bad_data={}",
+            table_name,
+            callback.from_user.id,
+            result.total_rows,
+            result.inserted,
+            result.updated,
+            result.deleted,
+            result.skipped,
+            result.bad_data,
         )
 
     except Exception as e:
-        logger.error(f"❌ Error during {table_name} sync: {e}")
+        logger.error("❌ Error during {} sync: {}", table_name, e)
         error_message = admin_messages.sync_error.format(error=str(e))
         await callback.message.edit_text(
             text=error_message,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
+            reply_markup=admin_messages.ADMIN_MENU_KEYBOARD,
         )
 
 
@@ -111,14 +168,14 @@ async def show_admin_menu(message: Message, dialog_manager: DialogManager):
     """Show admin menu with inline keyboard."""
     try:
         await dialog_manager.reset_stack()
-        logger.debug(f"🔄 Admin {message.from_user.id} reset to admin menu")
+        logger.debug("🔄 Admin {} reset to admin menu", message.from_user.id)
         await message.answer(
             text=admin_messages.admin_welcome,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
+            reply_markup=admin_messages.ADMIN_MENU_KEYBOARD,
         )
-        logger.debug(f"👑 Admin menu shown to {message.from_user.id}")
+        logger.debug("👑 Admin menu shown to {}", message.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error showing admin menu: {e}")
+        logger.error("❌ Error showing admin menu: {}", e)
         await message.answer("❌ Ошибка отображения админ-меню")
 
 
@@ -129,182 +186,126 @@ async def back_to_admin_menu(
     """Show admin menu with inline keyboard from aiogram-dialog context."""
     try:
         await dialog_manager.reset_stack()
-        logger.debug(f"🔄 Admin {callback.from_user.id} reset to admin menu")
-        await callback.message.answer(
-            text=admin_messages.admin_welcome,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
-        )
-        await callback.answer()
-        logger.debug(f"👑 Admin menu shown to {callback.from_user.id}")
-    except Exception as e:
-        logger.error(f"❌ Error showing admin menu: {e}")
-        await callback.message.answer("❌ Ошибка отображения админ-меню")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_back_to_menu", is_admin_callback)
-async def back_to_admin_menu_regular(callback: CallbackQuery):
-    """Show admin menu with inline keyboard from regular callback context."""
-    try:
+        logger.debug("🔄 Admin {} reset to admin menu", callback.from_user.id)
+        # Turn the closed dialog's message into the menu instead of posting a new one
         await callback.message.edit_text(
             text=admin_messages.admin_welcome,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
+            reply_markup=admin_messages.ADMIN_MENU_KEYBOARD,
         )
         await callback.answer()
-        logger.debug(f"👑 Admin menu shown to {callback.from_user.id}")
+        logger.debug("👑 Admin menu shown to {}", callback.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error showing admin menu: {e}")
+        logger.error("❌ Error showing admin menu: {}", e)
         await callback.message.answer("❌ Ошибка отображения админ-меню")
         await callback.answer()
 
 
-@admin_menu_router.callback_query(F.data == "admin_pending_users", is_admin_callback)
-async def start_pending_users_dialog(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Start pending users managment dialog."""
-    try:
-        await dialog_manager.start(
-            state=states.PendingUsersStatesGroup.users_list,
-            mode=StartMode.RESET_STACK,
-        )
-        await callback.answer()
-        logger.debug(f"📋 Admin {callback.from_user.id} started pending users dialog")
-    except Exception as e:
-        logger.error(f"❌ Error starting pending users dialog: {e}")
-        await callback.message.answer("❌ Ошибка запуска диалога заявок")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_add_user", is_admin_callback)
-async def start_add_user_dialog(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Start  manual add user dialog."""
-    try:
-        await dialog_manager.start(
-            state=states.AddUserStatesGroup.telegram_id,
-            mode=StartMode.RESET_STACK,
-        )
-        await callback.answer()
-        logger.debug(f"➕ Admin {callback.from_user.id} started add user dialog")
-    except Exception as e:
-        logger.error(f"❌ Error starting add user dialog: {e}")
-        await callback.message.answer("❌ Ошибка запуска диалога добавления пользователя")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_ban_user", is_admin_callback)
-async def start_ban_user_dialog(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Start ban user dialog."""
-    try:
-        await dialog_manager.start(
-            state=states.BanUserStatesGroup.user_search, mode=StartMode.RESET_STACK
-        )
-        await callback.answer()
-        logger.info(f"🚫 Admin {callback.from_user.id} started ban user dialog")
-    except Exception as e:
-        logger.error(f"❌ Error starting ban user dialog: {e}")
-        await callback.message.answer("❌ Ошибка запуска диалога блокировки пользователя")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_broadcast", is_admin_callback)
-async def start_broadcast_dialog(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Start broadcast dialog."""
-    try:
-        await dialog_manager.start(
-            state=states.BroadcastStatesGroup.message, mode=StartMode.RESET_STACK
-        )
-        await callback.answer()
-        logger.info(f"📢 Admin {callback.from_user.id} started broadcast dialog")
-    except Exception as e:
-        logger.error(f"❌ Error starting broadcast dialog: {e}")
-        await callback.message.answer("❌ Ошибка запуска диалога рассылки")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_sync_google_sheets", is_admin_callback)
-async def start_google_sheets_sync(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Show table selection for Google Sheets sync."""
-    try:
-        await callback.message.edit_text(
-            text=admin_messages.sync_choose_table_prompt,
-            reply_markup=admin_messages.get_table_selection_keyboard(),
-        )
-        await callback.answer()
-        logger.info(f"🔄 Admin {callback.from_user.id} started Google Sheets table selection")
-    except Exception as e:
-        logger.error(f"❌ Error starting Google Sheets sync: {e}")
-        await callback.message.answer("❌ Ошибка запуска синхронизации")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_sync_table_carpets", is_admin_callback)
-async def start_carpets_sync_confirmation(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Show carpets sync confirmation."""
-    try:
-        await callback.message.edit_text(
-            text=admin_messages.sync_carpets_prompt,
-            reply_markup=admin_messages.get_confirmation_keyboard("sync_carpets"),
-        )
-        await callback.answer()
-        logger.info(f"🧿 Admin {callback.from_user.id} started carpets sync confirmation")
-    except Exception as e:
-        logger.error(f"❌ Error starting carpets sync: {e}")
-        await callback.message.answer("❌ Ошибка запуска синхронизации ковров")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_sync_table_sales", is_admin_callback)
-async def start_sales_sync_confirmation(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Show sales sync confirmation."""
-    try:
-        await callback.message.edit_text(
-            text=admin_messages.sync_sales_prompt,
-            reply_markup=admin_messages.get_confirmation_keyboard("sync_sales"),
-        )
-        await callback.answer()
-        logger.info(f"💰 Admin {callback.from_user.id} started sales sync confirmation")
-    except Exception as e:
-        logger.error(f"❌ Error starting sales sync: {e}")
-        await callback.message.answer("❌ Ошибка запуска синхронизации продаж")
-        await callback.answer()
-
-
-@admin_menu_router.callback_query(F.data == "admin_confirm_sync_carpets", is_admin_callback)
 async def confirm_carpets_sync(callback: CallbackQuery, dialog_manager: DialogManager):
     """Execute carpets sync with spinning animation."""
     await perform_sync_with_animation(
         callback=callback,
         service_class=GoogleSheetsCarpetService,
-        sync_method="sync_carpets",
-        spreadsheet_id=base_settings.GOOGLE_SPREADSHEET_ID,
-        worksheet_title=base_settings.GOOGLE_CARPETS_SHEET_TITLE,
+        sync_method=GoogleSheetsCarpetService.sync_carpets,
+        spreadsheet_id=SPREADSHEET_ID,
+        worksheet_title=CARPETS_SHEET_TITLE,
         table_name="Carpets",
     )
+    # The sync session is committed by now, so fresh counts can be cached again
+    invalidate_search_caches()
 
 
-@admin_menu_router.callback_query(F.data == "admin_confirm_sync_sales", is_admin_callback)
 async def confirm_sales_sync(callback: CallbackQuery, dialog_manager: DialogManager):
     """Execute sales sync with spinning animation."""
     await perform_sync_with_animation(
         callback=callback,
         service_class=GoogleSheetsSalesService,
-        sync_method="sync_sales",
-        spreadsheet_id=base_settings.GOOGLE_SPREADSHEET_ID,
-        worksheet_title=base_settings.GOOGLE_SALES_SHEET_TITLE,
+        sync_method=GoogleSheetsSalesService.sync_sales,
+        spreadsheet_id=SPREADSHEET_ID,
+        worksheet_title=SALES_SHEET_TITLE,
         table_name="Sales",
     )
 
 
-@admin_menu_router.callback_query(F.data == "admin_cancel", is_admin_callback)
-async def cancel_admin_operation(callback: CallbackQuery, dialog_manager: DialogManager):
-    """Cancel admin operation and return to main menu."""
-    try:
-        await callback.message.edit_text(
-            text=admin_messages.admin_welcome,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
-        )
-        await callback.answer()
-        logger.debug(f"❌ Admin {callback.from_user.id} cancelled operation")
-    except Exception as e:
-        logger.error(f"❌ Error cancelling operation: {e}")
-        await callback.message.answer("❌ Ошибка отмены операции")
-        await callback.answer()
+def _start_dialog_handler(
+    state: State, log_message: str, error_message: str
+) -> AdminCallbackHandler:
+    """Build a callback handler that starts an admin dialog from a clean stack."""
+
+    async def handler(callback: CallbackQuery, dialog_manager: DialogManager) -> None:
+        try:
+            await dialog_manager.start(state=state, mode=StartMode.RESET_STACK)
+            await callback.answer()
+            logger.info("{}: {}", log_message, callback.from_user.id)
+        except Exception as e:
+            logger.error("❌ Error starting admin dialog {}: {}", callback.data, e)
+            await callback.message.answer(error_message)
+            await callback.answer()
+
+    return handler
+
+
+def _edit_menu_handler(
+    text: str, reply_markup: InlineKeyboardMarkup, log_message: str, error_message: str
+) -> AdminCallbackHandler:
+    """Build a callback handler that replaces the admin message with another menu screen."""
+
+    async def handler(callback: CallbackQuery, dialog_manager: DialogManager) -> None:
+        try:
+            await callback.message.edit_text(text=text, reply_markup=reply_markup)
+            await callback.answer()
+            logger.info("{}: {}", log_message, callback.from_user.id)
+        except Exception as e:
+            logger.error("❌ Error showing admin screen {}: {}", callback.data, e)
+            await callback.message.answer(error_message)
+            await callback.answer()
+
+    return handler
+
+
+# Callback data -> (screen text, keyboard, log message, user-facing error)
+_ADMIN_SCREENS = {
+    "admin_back_to_menu": (
+        admin_messages.admin_welcome,
+        admin_messages.ADMIN_MENU_KEYBOARD,
+        "👑 Admin menu shown to",
+        "❌ Ошибка отображения админ-меню",
+    ),
+    "admin_cancel": (
+        admin_messages.admin_welcome,
+        admin_messages.ADMIN_MENU_KEYBOARD,
+        "❌ Operation cancelled by admin",
+        "❌ Ошибка отмены операции",
+    ),
+    "admin_sync_google_sheets": (
+        admin_messages.sync_choose_table_prompt,
+        admin_messages.get_table_selection_keyboard(),
+        "🔄 Google Sheets table selection started by admin",
+        "❌ Ошибка запуска синхронизации",
+    ),
+    "admin_sync_table_carpets": (
+        admin_messages.sync_carpets_prompt,
+        admin_messages.get_confirmation_keyboard("sync_carpets"),
+        "🧿 Carpets sync confirmation started by admin",
+        "❌ Ошибка запуска синхронизации ковров",
+    ),
+    "admin_sync_table_sales": (
+        admin_messages.sync_sales_prompt,
+        admin_messages.get_confirmation_keyboard("sync_sales"),
+        "💰 Sales sync confirmation started by admin",
+        "❌ Ошибка запуска синхронизации продаж",
+    ),
+}
+
+# Exact callback data -> handler, so one registered handler dispatches by hash lookup
+ADMIN_CALLBACKS: dict[str, AdminCallbackHandler] = {
+    **{data: _start_dialog_handler(*dialog) for data, dialog in _ADMIN_DIALOGS.items()},
+    **{data: _edit_menu_handler(*screen) for data, screen in _ADMIN_SCREENS.items()},
+    "admin_confirm_sync_carpets": confirm_carpets_sync,
+    "admin_confirm_sync_sales": confirm_sales_sync,
+}
+
+
+@admin_menu_router.callback_query(F.data.in_(ADMIN_CALLBACKS.keys()), is_admin_callback)
+async def dispatch_admin_callback(callback: CallbackQuery, dialog_manager: DialogManager):
+    """Route an admin menu callback to its handler."""
+    await ADMIN_CALLBACKS[callback.data](callback, dialog_manager)
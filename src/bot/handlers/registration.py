@@ -7,7 +7,6 @@ from aiogram_dialog.widgets.kbd import Button
 from loguru import logger
 
 from src.core_settings import base_settings, bot
-from src.database import db
 from src.services.admin.users_managment import AdminUserManagementService
 from src.services.user_registration import RegistrationService, messages
 
@@ -21,28 +20,27 @@ class RegistrationFieldHandler:
         self.normalize = normalize
 
     async def __call__(self, message: Message, _, dialog_manager: DialogManager):
-        telegram_id = message.from_user.id
+        user = message.from_user
+        telegram_id, username = user.id, user.username
         value = message.text.strip()
         if self.normalize:
             value = self.normalize(value)
 
-        async with db.get_session() as session:
-            registration_service = RegistrationService(session)
-            validation = registration_service.validate_field(
-                field_name=self.field_name,
-                value=value,
-                telegram_id=telegram_id,
-                username=message.from_user.username,
-            )
+        validation = RegistrationService.validate_field(
+            field_name=self.field_name,
+            value=value,
+            telegram_id=telegram_id,
+            username=username,
+        )
         if not validation.is_valid:
             await message.answer(f"❌ {validation.error_message}")
             return
 
         dialog_manager.dialog_data[self.field_name] = getattr(validation, "cleaned_value", value)
         if self.field_name == "first_name":
-            dialog_manager.dialog_data["username"] = message.from_user.username
+            dialog_manager.dialog_data["username"] = username
 
-        logger.info(f"✅ {self.field_name} saved for user {telegram_id}")
+        logger.info("✅ {} saved for user {}", self.field_name, telegram_id)
         await dialog_manager.switch_to(self.next_state)
 
 
@@ -51,7 +49,7 @@ async def skip_phone_handler(
 ):
     telegram_id = callback.from_user.id
     dialog_manager.dialog_data["phone"] = None
-    logger.info(f"📱 Phone skipped for user {telegram_id}")
+    logger.info("📱 Phone skipped for user {}", telegram_id)
     await dialog_manager.next()
 
 
@@ -61,43 +59,41 @@ async def save_registration_data(
     telegram_id = callback.from_user.id
     data = dialog_manager.dialog_data
     try:
-        async with db.get_session() as session:
-            registration_service = RegistrationService(session)
-            admin_service = AdminUserManagementService(session, bot)
-            exists, status_message = await registration_service.check_existing_user(telegram_id)
-            if exists:
-                await callback.message.answer(f"⚠️ {status_message}")
-                await dialog_manager.done()
-                return
+        session = dialog_manager.middleware_data["db_session"]
+        registration_service = RegistrationService(session)
+        admin_service = AdminUserManagementService(session, bot)
+        exists, status_message = await registration_service.check_existing_user(telegram_id)
+        if exists:
+            await callback.message.answer(f"⚠️ {status_message}")
+            await dialog_manager.done()
+            return
 
-            is_valid, error_message, registration_data = (
-                registration_service.validate_full_registration(
-                    telegram_id=telegram_id,
-                    username=data["username"],
-                    first_name=data["first_name"],
-                    last_name=data["last_name"],
-                    email=data["email"],
-                    phone=data["phone"],
-                    from_whom=data["from_whom"],
-                )
+        is_valid, error_message, registration_data = (
+            registration_service.validate_full_registration(
+                telegram_id=telegram_id,
+                username=data["username"],
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                email=data["email"],
+                phone=data["phone"],
+                from_whom=data["from_whom"],
             )
-            if not is_valid:
-                await callback.message.answer(f"❌ {error_message}")
-                return
+        )
+        if not is_valid:
+            await callback.message.answer(f"❌ {error_message}")
+            return
 
-            success = await registration_service.save_registration(
-                registration_data=registration_data
+        success = await registration_service.save_registration(registration_data=registration_data)
+        if success:
+            await callback.message.answer(messages.registration_success)
+            await admin_service.notify_admins_new_registration(
+                admin_ids=base_settings.ADMIN_IDS,
+                user_data=registration_data,
             )
-            if success:
-                await callback.message.answer(messages.registration_success)
-                await admin_service.notify_admins_new_registration(
-                    admin_ids=base_settings.ADMIN_IDS,
-                    user_data=registration_data,
-                )
-                logger.info(f"✅ Registration completed for user {telegram_id}")
-            else:
-                await callback.message.answer(messages.registration_error)
-            await dialog_manager.done()
+            logger.info("✅ Registration completed for user {}", telegram_id)
+        else:
+            await callback.message.answer(messages.registration_error)
+        await dialog_manager.done()
     except Exception as e:
-        logger.error(f"❌ Error in registration for telegram_id: {telegram_id}: {e}")
+        logger.error("❌ Error in registration for telegram_id: {}: {}", telegram_id, e)
         await callback.message.answer(messages.registration_error)
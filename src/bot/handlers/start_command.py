@@ -1,11 +1,13 @@
+from collections.abc import Awaitable, Callable
+
 from aiogram import F, Router
 from aiogram.filters import CommandStart
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import DialogManager, StartMode
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.handlers.utils import is_admin_callback
-from src.database import db
 from src.services.admin.messages import messages as admin_messages
 from src.services.carpet_search.states import CarpetSearchStatesGroup
 from src.services.start_command import (
@@ -17,51 +19,72 @@ from src.services.start_command import (
 
 start_command_router = Router()
 
+StartResponseSender = Callable[[Message, StartCommandResponse], Awaitable[None]]
+
+
+async def _show_registration(message: Message, response: StartCommandResponse):
+    await message.answer(
+        text=messages.get_full_message(response.message, messages.new_user_instructions),
+        reply_markup=messages.get_registration_keyboard(),
+    )
+
+
+async def _show_admin_panel(message: Message, response: StartCommandResponse):
+    await message.answer(
+        text=response.message,
+        reply_markup=messages.get_admin_start_menu_keyboard(),
+    )
+
+
+async def _show_main_menu(message: Message, response: StartCommandResponse):
+    await message.answer(
+        text=response.message,
+        reply_markup=messages.get_main_menu_keyboard(),
+    )
+
+
+async def _show_pending_status(message: Message, response: StartCommandResponse):
+    await message.answer(messages.get_full_message(response.message, messages.pending_info))
+
+
+async def _show_banned_message(message: Message, response: StartCommandResponse):
+    await message.answer(messages.get_full_message(response.message, messages.support_contact))
+
+
+async def _show_plain_message(message: Message, response: StartCommandResponse):
+    await message.answer(response.message)
+
+
+_ACTION_DISPATCH: dict[StartCommandAction, StartResponseSender] = {
+    StartCommandAction.SHOW_REGISTRATION: _show_registration,
+    StartCommandAction.SHOW_ADMIN_PANEL: _show_admin_panel,
+    StartCommandAction.SHOW_MAIN_MENU: _show_main_menu,
+    StartCommandAction.SHOW_PENDING_STATUS: _show_pending_status,
+    StartCommandAction.SHOW_BANNED_MESSAGE: _show_banned_message,
+    StartCommandAction.ERROR: _show_plain_message,
+}
+
 
 async def _send_response_by_action(message: Message, response: StartCommandResponse):
     """Send response based on action type."""
-
-    match response.action:
-        case StartCommandAction.SHOW_REGISTRATION:
-            await message.answer(
-                text=messages.get_full_message(response.message, messages.new_user_instructions),
-                reply_markup=messages.get_registration_keyboard(),
-            )
-        case StartCommandAction.SHOW_ADMIN_PANEL:
-            await message.answer(
-                text=response.message,
-                reply_markup=messages.get_admin_start_menu_keyboard(),
-            )
-        case StartCommandAction.SHOW_MAIN_MENU:
-            await message.answer(
-                text=response.message,
-                reply_markup=messages.get_main_menu_keyboard(),
-            )
-        case StartCommandAction.SHOW_PENDING_STATUS:
-            await message.answer(messages.get_full_message(response.message, messages.pending_info))
-        case StartCommandAction.SHOW_BANNED_MESSAGE:
-            await message.answer(
-                messages.get_full_message(response.message, messages.support_contact)
-            )
-        case StartCommandAction.ERROR:
-            await message.answer(response.message)
+    sender = _ACTION_DISPATCH.get(response.action, _show_plain_message)
+    await sender(message, response)
 
 
 @start_command_router.message(CommandStart())
-async def handle_start_command(message: Message):
+async def handle_start_command(message: Message, db_session: AsyncSession):
     """Handle /start command with a user type determination and appropriate response."""
 
     telegram_id = message.from_user.id
-    logger.info(f"🚀 Start command received from user: {telegram_id}")
+    logger.info("🚀 Start command received from user: {}", telegram_id)
 
     try:
-        async with db.get_session() as session:
-            start_service = StartCommandService(session)
-            response = await start_service.process_start_command(telegram_id)
-            await _send_response_by_action(message, response)
+        start_service = StartCommandService(db_session)
+        response = await start_service.process_start_command(telegram_id)
+        await _send_response_by_action(message, response)
 
     except Exception as e:
-        logger.error(f"❌ Error processing start command for {telegram_id}: {e}")
+        logger.error("❌ Error processing start command for {}: {}", telegram_id, e)
         await message.answer(messages.processing_error)
 
 
@@ -71,12 +94,12 @@ async def handle_admin_panel_redirect(callback: CallbackQuery):
     try:
         await callback.message.edit_text(
             text=admin_messages.admin_welcome,
-            reply_markup=admin_messages.get_admin_menu_keyboard(),
+            reply_markup=admin_messages.ADMIN_MENU_KEYBOARD,
         )
         await callback.answer()
-        logger.info(f"👑 Admin {callback.from_user.id} redirected to admin panel")
+        logger.info("👑 Admin {} redirected to admin panel", callback.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error redirecting to admin panel: {e}")
+        logger.error("❌ Error redirecting to admin panel: {}", e)
         await callback.answer("❌ Ошибка перехода в админ-панель")
 
 
@@ -88,9 +111,9 @@ async def handle_find_carpets(callback: CallbackQuery, dialog_manager: DialogMan
             state=CarpetSearchStatesGroup.main_menu, mode=StartMode.RESET_STACK
         )
         await callback.answer()
-        logger.info(f"🔍 User {callback.from_user.id} started carpet search")
+        logger.info("🔍 User {} started carpet search", callback.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error launching carpet search for {callback.from_user.id}: {e}")
+        logger.error("❌ Error launching carpet search for {}: {}", callback.from_user.id, e)
         await callback.answer("❌ Ошибка запуска поиска ковров")
 
 
@@ -99,9 +122,9 @@ async def handle_favorites(callback: CallbackQuery):
     """Handle favorites button click."""
     try:
         await callback.answer("❤️ Функция избранного будет реализована позже")
-        logger.info(f"❤️ User {callback.from_user.id} clicked favorites")
+        logger.info("❤️ User {} clicked favorites", callback.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error handling favorites: {e}")
+        logger.error("❌ Error handling favorites: {}", e)
         await callback.answer("❌ Ошибка")
 
 
@@ -110,7 +133,7 @@ async def handle_create_pdf(callback: CallbackQuery):
     """Handle create PDF button click."""
     try:
         await callback.answer("📄 Функция создания PDF будет реализована позже")
-        logger.info(f"📄 User {callback.from_user.id} clicked create PDF")
+        logger.info("📄 User {} clicked create PDF", callback.from_user.id)
     except Exception as e:
-        logger.error(f"❌ Error handling create PDF: {e}")
+        logger.error("❌ Error handling create PDF: {}", e)
         await callback.answer("❌ Ошибка")
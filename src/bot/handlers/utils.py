@@ -14,19 +14,14 @@ async def reject_non_text(
     await message.answer(messages.non_text_error)
 
 
-async def data_getter(dialog_manager: DialogManager, **kwargs):
-    """Get data from a dialog manager."""
-    return dialog_manager.dialog_data
-
-
 async def is_admin_message(message: Message) -> bool:
     """Check if user is an admin."""
-    return message.from_user.id in base_settings.ADMIN_IDS
+    return message.from_user.id in base_settings.ADMIN_IDS_SET
 
 
 async def is_admin_callback(callback: CallbackQuery) -> bool:
     """Check if user is an admin."""
-    return callback.from_user.id in base_settings.ADMIN_IDS
+    return callback.from_user.id in base_settings.ADMIN_IDS_SET
 
 
 async def skip_optional_field(
@@ -0,0 +1,26 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from src.database import db
+
+
+class DBSessionMiddleware(BaseMiddleware):
+    """Open one database session per update and share it via data["db_session"].
+
+    Handlers and dialog getters triggered by the same update reuse this session, so a
+    click that re-renders a window checks out a single connection. The session is
+    committed after the update is processed and rolled back on an unhandled error.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with db.get_session() as session:
+            data["db_session"] = session
+            return await handler(event, data)
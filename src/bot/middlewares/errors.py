@@ -0,0 +1,39 @@
+import contextlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import TelegramObject, Update
+from loguru import logger
+
+INTERNAL_ERROR_TEXT = "❌ Внутренняя ошибка"
+
+
+class ErrorMiddleware(BaseMiddleware):
+    """Log errors escaping update handlers and tell the user something went wrong.
+
+    Handlers without specific recovery logic can let exceptions propagate instead of
+    wrapping their bodies in try/except. Registered outermost, so it also sees
+    errors raised while committing the per-update database session.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        try:
+            return await handler(event, data)
+        except Exception as e:
+            update_id = event.update_id if isinstance(event, Update) else None
+            logger.exception("❌ Unhandled error in update {}: {}", update_id, e)
+            if isinstance(event, Update):
+                # The handler may have answered already; a second answer is not worth failing on
+                with contextlib.suppress(TelegramAPIError):
+                    if event.callback_query:
+                        await event.callback_query.answer(INTERNAL_ERROR_TEXT)
+                    elif event.message:
+                        await event.message.answer(INTERNAL_ERROR_TEXT)
+            return None
@@ -1,7 +1,9 @@
 import re
+from functools import cached_property, lru_cache
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from loguru import logger
 from pydantic import BaseModel, field_validator
@@ -20,6 +22,14 @@ class DatabaseSettings(BaseModel):
 
     url: str
     echo: bool = False
+    # Sized for concurrent update handlers; each handler holds one session for its update
+    pool_size: int = 20
+    max_overflow: int = 10
+    # Recycling replaces stale connections, so checkouts skip the pre-ping round trip
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    # Rows per multi-VALUES statement when an INSERT is executed with many parameter sets
+    insertmanyvalues_page_size: int = 1000
 
     @field_validator("url")
     @classmethod
@@ -58,14 +68,19 @@ class Settings(BaseSettings):
     GOOGLE_CARPETS_SHEET_TITLE: str
     GOOGLE_SALES_SHEET_TITLE: str
 
+    @cached_property
+    def ADMIN_IDS_SET(self) -> frozenset[int]:
+        """Admin ids as a set for constant-time membership checks."""
+        return frozenset(self.ADMIN_IDS)
+
     def __init__(self, **data):
         super().__init__(**data)
         logger.info("⚙️ Settings loaded.")
-        logger.debug(f"🐘 Database URL: {self.DATABASE.url}")
-        logger.debug(f"🤖 Bot token: {self.BOT_TOKEN[:5]}***")
-        logger.debug(f"🪵 Log level: {self.LOG_LEVEL}")
-        logger.debug(f"📊 Google Sheets ID: {self.GOOGLE_SPREADSHEET_ID}")
-        logger.debug(f"👑 Admin IDs: {self.ADMIN_IDS}")
+        logger.debug("🐘 Database URL: {}", self.DATABASE.url)
+        logger.debug("🤖 Bot token: {}***", self.BOT_TOKEN[:5])
+        logger.debug("🪵 Log level: {}", self.LOG_LEVEL)
+        logger.debug("📊 Google Sheets ID: {}", self.GOOGLE_SPREADSHEET_ID)
+        logger.debug("👑 Admin IDs: {}", self.ADMIN_IDS)
 
     @field_validator(
         "BOT_TOKEN",
@@ -93,9 +108,17 @@ class Settings(BaseSettings):
         return value
 
 
-base_settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, building it on first call."""
+    return Settings()
+
+
+base_settings = get_settings()
 bot_properties = DefaultBotProperties(
     parse_mode=ParseMode.HTML,
 )
-bot = Bot(token=base_settings.BOT_TOKEN, default=bot_properties)
+# One pooled HTTP session serves every Bot API call, so connections are reused across updates
+bot_session = AiohttpSession(limit=100)
+bot = Bot(token=base_settings.BOT_TOKEN, default=bot_properties, session=bot_session)
 dp = Dispatcher()
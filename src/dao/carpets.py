@@ -1,27 +1,60 @@
-import asyncio
 from typing import Dict, List, Sequence, Tuple
 
 from loguru import logger
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import (
+    CompoundSelect,
+    Result,
+    Select,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    union,
+    union_all,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models.carpets import Carpet
+from src.cache import TTLCache
+from src.database.models.carpets import Carpet, CarpetColor
+
+# Distinct filter values change only with a carpets sync, which clears this cache
+_unique_values_cache: TTLCache[list[str]] = TTLCache(maxsize=16, ttl=300)
+# Bumped on every clear, so a query started before a sync cannot store stale values
+_unique_values_generation = 0
+
+
+def clear_unique_values_cache() -> None:
+    """Drop cached distinct filter values after carpets data has changed."""
+    global _unique_values_generation
+    _unique_values_generation += 1
+    _unique_values_cache.clear()
 
 
 class CarpetsDAO:
+    _valid_fields = ("collection", "geometry", "size", "style", "color")
+    # Colors are checked separately
+    _filtered_fields = (
+        ("geometry", Carpet.geometry),
+        ("size", Carpet.size),
+        ("style", Carpet.style),
+        ("collection", Carpet.collection),
+    )
 
     def __init__(self, session: AsyncSession, filter_available_only: bool = True):
         self.session = session
         self.filter_available_only = filter_available_only
-        self._valid_fields = ["collection", "geometry", "size", "style", "color"]
 
     async def get_unique_filter_values(self, field_name: str) -> list[str]:
         """Get unique values for carpet filter attributes.
         Will be used to display all unique values for filtering users choice for carpets.
+        Results are cached per field for five minutes.
 
         Args:
-            field_name: Filter field name ('collection', 'geometry', 'size', 'style', 'colors')
+            field_name: Filter field name ('collection', 'geometry', 'size', 'style', 'color')
 
         Returns:
             Sorted list of unique string values for the specified field
@@ -33,32 +66,31 @@ class CarpetsDAO:
         if field_name not in self._valid_fields:
             raise ValueError(f"Invalid field_name. Must be one of: {self._valid_fields}")
 
-        try:
-            if field_name == "colors":
-                # Get all color values from three columns in parallel
-                color_fields = [Carpet.color_1, Carpet.color_2, Carpet.color_3]
-                color_queries = [
-                    select(field).distinct().where(field.is_not(None)) for field in color_fields
-                ]
-                results = await asyncio.gather(
-                    *[self.session.execute(query) for query in color_queries]
-                )
+        cached = _unique_values_cache.get(field_name)
+        if cached is not None:
+            return list(cached)
 
-                # Combine all unique colors
-                all_unique_colors = set()
-                for result in results:
-                    all_unique_colors.update(row[0] for row in result.fetchall())
-                values = list(all_unique_colors)
+        generation = _unique_values_generation
+        try:
+            if field_name == "color":
+                query = select(CarpetColor.color).distinct().order_by(CarpetColor.color)
             else:
                 # Get unique values for single field
                 field_attr = getattr(Carpet, field_name)
-                query = select(field_attr).distinct().where(field_attr.is_not(None))
-                result = await self.session.execute(query)
-                values = [row[0] for row in result.fetchall()]
-            return sorted(values)
+                query = (
+                    select(field_attr)
+                    .distinct()
+                    .where(field_attr.is_not(None))
+                    .order_by(field_attr)
+                )
+            result = await self._execute_core(query)
+            values = result.scalars().all()
+            if generation == _unique_values_generation:
+                _unique_values_cache.set(field_name, values)
+            return list(values)
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get unique values for field '{field_name}': {e}")
+            logger.error("❌ Failed to get unique values for field '{}': {}", field_name, e)
             raise
 
     async def get_filtered_unique_values(
@@ -71,7 +103,7 @@ class CarpetsDAO:
             existing_filters: Dict of currently applied filters
 
         Returns:
-            List of tuples (value, count) for the specified field
+            List of tuples (value, count) for the specified field, ordered by value
 
         Raises:
             ValueError: If field_name is not a valid filter field
@@ -87,10 +119,52 @@ class CarpetsDAO:
                 values_with_counts = await self._get_color_counts(conditions)
             else:
                 values_with_counts = await self._get_field_counts(field_name, conditions)
-            return sorted(values_with_counts, key=lambda x: x[0])
+            return values_with_counts
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get filtered values for field '{field_name}': {e}")
+            logger.error("❌ Failed to get filtered values for field '{}': {}", field_name, e)
+            raise
+
+    async def get_all_filtered_unique_values(
+        self, existing_filters: Dict[str, List[str]]
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """Get value counts of every filter field in one query.
+
+        Each field is counted under the existing filters minus its own, exactly as
+        get_filtered_unique_values does, and the per-field queries are combined with
+        UNION ALL so the whole filter panel costs one round trip.
+
+        Args:
+            existing_filters: Dict of currently applied filters
+
+        Returns:
+            Dict mapping each filter field to its (value, count) tuples, ordered by value
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            per_field = []
+            for field_name in self._valid_fields:
+                conditions = self._build_filter_conditions(
+                    {k: v for k, v in existing_filters.items() if k != field_name}
+                )
+                if field_name == "color":
+                    query = self._color_counts_query(conditions)
+                else:
+                    query = self._field_counts_query(field_name, conditions)
+                per_field.append(query.add_columns(literal(field_name).label("field")))
+
+            query = union_all(*per_field).order_by("field", "value")
+            values_by_field: Dict[str, List[Tuple[str, int]]] = {
+                field_name: [] for field_name in self._valid_fields
+            }
+            for value, count, field_name in (await self._execute_core(query)).all():
+                values_by_field[field_name].append((value, count))
+            return values_by_field
+
+        except SQLAlchemyError as e:
+            logger.error("❌ Failed to get filtered values for all fields: {}", e)
             raise
 
     async def search_carpets(
@@ -118,7 +192,47 @@ class CarpetsDAO:
             return result.scalars().all()
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to search carpets with filters: {e}")
+            logger.error("❌ Failed to search carpets with filters: {}", e)
+            raise
+
+    async def search_carpets_with_count(
+        self, filters: Dict[str, List[str]], limit: int = 50, offset: int = 0
+    ) -> Tuple[List[Carpet], int]:
+        """Search carpets and count all matches in a single query.
+
+        The total is computed with COUNT(*) OVER () alongside the page rows.
+
+        Args:
+            filters: Dict of filter criteria
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            Tuple of (carpets on the requested page, total number of matching carpets)
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            conditions = self._build_filter_conditions(filters)
+            if self.filter_available_only:
+                conditions.append(Carpet.quantity > 0)
+            query = (
+                select(Carpet, func.count().over().label("total"))
+                .where(and_(*conditions))
+                .limit(limit)
+                .offset(offset)
+            )
+            result = await self.session.execute(query)
+            rows = result.all()
+            if not rows:
+                # Page past the end carries no total, so count separately
+                total = await self.count_filtered_carpets(filters) if offset else 0
+                return [], total
+            return [row[0] for row in rows], rows[0].total
+
+        except SQLAlchemyError as e:
+            logger.error("❌ Failed to search carpets with count: {}", e)
             raise
 
     async def count_filtered_carpets(self, filters: Dict[str, List[str]]) -> int:
@@ -138,74 +252,91 @@ class CarpetsDAO:
             if self.filter_available_only:
                 conditions.append(Carpet.quantity > 0)
             query = select(func.count(Carpet.carpet_id)).where(and_(*conditions))
-            result = await self.session.execute(query)
+            result = await self._execute_core(query)
             return result.scalar() or 0
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to count filtered carpets: {e}")
+            logger.error("❌ Failed to count filtered carpets: {}", e)
             raise
 
-    @staticmethod
-    def _build_filter_conditions(filters: Dict[str, List[str]]) -> List:
+    async def _execute_core(self, query: Select | CompoundSelect) -> Result:
+        """Run a column-only query on the session's connection, skipping ORM result handling.
+
+        Filter values and counts are plain scalars, so they need no entity loading,
+        identity map lookups or autoflush.
+        """
+        connection = await self.session.connection()
+        return await connection.execute(query)
+
+    @classmethod
+    def _build_filter_conditions(cls, filters: Dict[str, List[str]]) -> List:
         """Build SQLAlchemy filter conditions from filters dict."""
         conditions = []
-
-        # Colors checked separately
-        filtered_fields = {
-            "geometry": Carpet.geometry,
-            "size": Carpet.size,
-            "style": Carpet.style,
-            "collection": Carpet.collection,
-        }
-        for field_name, field_value in filtered_fields.items():
+        for field_name, field_attr in cls._filtered_fields:
             if filtered_values := filters.get(field_name):
-                conditions.append(field_value.in_(filtered_values))
+                conditions.append(field_attr.in_(filtered_values))
 
         if filtered_colors := filters.get("color"):
-            color_conditions = [
-                or_(
-                    Carpet.color_1 == color,
-                    Carpet.color_2 == color,
-                    Carpet.color_3 == color,
+            # A carpet matches if any of its colors is among the selected ones
+            conditions.append(
+                exists().where(
+                    CarpetColor.carpet_id == Carpet.carpet_id,
+                    CarpetColor.color.in_(filtered_colors),
                 )
-                for color in filtered_colors
-            ]
-            conditions.append(or_(*color_conditions))
+            )
         return conditions
 
     async def _get_color_counts(self, conditions: list) -> list[tuple[str, int]]:
-        """Get aggregated counts across all three color columns."""
-        color_fields = [Carpet.color_1, Carpet.color_2, Carpet.color_3]
+        """Get the number of matching carpets per color."""
+        query = self._color_counts_query(conditions).order_by(CarpetColor.color)
+        result = await self._execute_core(query)
+        return [(value, count) for value, count in result.all()]
+
+    def _color_counts_query(self, conditions: list) -> Select:
+        """Build the per-color count query without ordering."""
         base_conditions = list(conditions)
         if self.filter_available_only:
             base_conditions.append(Carpet.quantity > 0)
-        queries = [
-            select(field.label("color"), func.count().label("count"))
-            .where(and_(field.is_not(None), *base_conditions))
-            .group_by(field)
-            for field in color_fields
-        ]
-        results = await asyncio.gather(*[self.session.execute(query) for query in queries])
-        color_counts = {}
-        logger.debug(f"Color results: {results}")
-        for result in results:
-            for row in result.fetchall():
-                logger.debug(f"Row: {row}")
-                color_value = row.color
-                count = row.count
-                color_counts[color_value] = color_counts.get(color_value, 0) + count
-        return list(color_counts.items())
+        return (
+            select(CarpetColor.color.label("value"), func.count().label("count"))
+            .join(Carpet, Carpet.carpet_id == CarpetColor.carpet_id)
+            .where(*base_conditions)
+            .group_by(CarpetColor.color)
+        )
+
+    async def rebuild_carpet_colors(self) -> None:
+        """Refill carpet_colors from the color columns of the carpets table.
+
+        Called after a carpets sync. UNION drops a color repeated in two slots, so
+        each carpet counts once per color.
+        """
+        carpet_colors = union(
+            *(
+                select(field, Carpet.carpet_id).where(field.is_not(None))
+                for field in (Carpet.color_1, Carpet.color_2, Carpet.color_3)
+            )
+        )
+        await self.session.execute(delete(CarpetColor))
+        await self.session.execute(
+            insert(CarpetColor).from_select(["color", "carpet_id"], carpet_colors)
+        )
 
     async def _get_field_counts(self, field_name: str, conditions: list) -> list[tuple[str, int]]:
         """Get value counts for a single field."""
+        query = self._field_counts_query(field_name, conditions).order_by(
+            getattr(Carpet, field_name)
+        )
+        result = await self._execute_core(query)
+        return [(value, count) for value, count in result.all()]
+
+    def _field_counts_query(self, field_name: str, conditions: list) -> Select:
+        """Build the value count query of a single field without ordering."""
         field_attr = getattr(Carpet, field_name)
         base_conditions = list(conditions)
         if self.filter_available_only:
             base_conditions.append(Carpet.quantity > 0)
-        query = (
-            select(field_attr, func.count().label("count"))
+        return (
+            select(field_attr.label("value"), func.count().label("count"))
             .where(and_(field_attr.is_not(None), *base_conditions))
             .group_by(field_attr)
         )
-        result = await self.session.execute(query)
-        return [(row[0], row[1]) for row in result.fetchall()]
@@ -1,8 +1,21 @@
+import msgspec
 from loguru import logger
-from sqlalchemy import Sequence, func, or_, select
+from sqlalchemy import (
+    Select,
+    Sequence,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.carpets import FavoriteCarpets
 from src.database.models.users import BannedUser, PendingUser, RegisteredUser
 from src.schemas.users import UserRegistrationInput
 
@@ -16,135 +29,214 @@ class UserDAO:
         try:
             return await self.session.get(RegisteredUser, telegram_id)
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get user by id: {e}")
+            logger.error("❌ Failed to get user by id: {}", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise
 
     async def get_banned_user_by_id(self, telegram_id: int) -> BannedUser | None:
         try:
             return await self.session.get(BannedUser, telegram_id)
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get user by id: {e}")
+            logger.error("❌ Failed to get user by id: {}", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise
 
+    async def is_banned_user(self, telegram_id: int) -> bool:
+        """Check for a ban by primary key only, without loading the banned user row."""
+        try:
+            banned_id = await self.session.scalar(
+                select(BannedUser.telegram_id).where(BannedUser.telegram_id == telegram_id)
+            )
+            return banned_id is not None
+        except SQLAlchemyError as e:
+            logger.error("❌ Failed to check banned user by id: {}", e)
+            raise
+
+    async def get_existing_user_status(self, telegram_id: int) -> str | None:
+        """Return "registered", "pending" or "banned" for a known user, else None."""
+        try:
+            return await self.session.scalar(self.existing_user_status_query(telegram_id))
+        except SQLAlchemyError as e:
+            logger.error("❌ Failed to get existing user status: {}", e)
+            raise
+
+    @staticmethod
+    def existing_user_status_query(telegram_id: int) -> Select:
+        """Build a query that returns "registered", "pending" or "banned" for a known user.
+
+        All three tables are checked in one statement; a new user yields no rows.
+        """
+        statuses = union_all(
+            *(
+                select(literal(priority).label("priority"), literal(status).label("status")).where(
+                    model.telegram_id == telegram_id
+                )
+                for priority, (status, model) in enumerate(
+                    (
+                        ("registered", RegisteredUser),
+                        ("pending", PendingUser),
+                        ("banned", BannedUser),
+                    )
+                )
+            )
+        ).subquery()
+        return select(statuses.c.status).order_by(statuses.c.priority).limit(1)
+
     async def get_all_registered_users(self) -> Sequence[RegisteredUser]:
         try:
             stmt = select(RegisteredUser)
             all_registered_users = await self.session.execute(stmt)
             return all_registered_users.scalars().all()
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get all registered users: {e}")
+            logger.error("❌ Failed to get all registered users: {}", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise
 
     async def get_pending_user_by_id(self, telegram_id: int) -> PendingUser | None:
         try:
             return await self.session.get(PendingUser, telegram_id)
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get pending user by id: {e}")
+            logger.error("❌ Failed to get pending user by id: {}", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise
 
     async def add_pending_user(self, user_data: UserRegistrationInput):
         try:
-            self.session.add(PendingUser(**user_data.model_dump()))
-            logger.info(f"✅ User {user_data.telegram_id} added to pending users")
+            self.session.add(PendingUser(**msgspec.structs.asdict(user_data)))
+            logger.info("✅ User {} added to pending users", user_data.telegram_id)
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to add pending user by id: {e}")
+            logger.error("❌ Failed to add pending user by id: {}", e)
             raise e
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise e
 
     async def approve_user(self, telegram_id: int, chosen_role: str):
-        pending_user = await self.get_pending_user_by_id(telegram_id)
-        if not pending_user:
-            logger.warning(f"No pending user found for id {telegram_id}")
-            return
+        """Move a pending user to registered users with the chosen role.
+
+        Copies the row with INSERT ... SELECT and deletes the pending row, so no
+        ORM objects are loaded.
+        """
         try:
-            self.session.add(
-                RegisteredUser(
-                    telegram_id=pending_user.telegram_id,
-                    username=pending_user.username,
-                    first_name=pending_user.first_name,
-                    last_name=pending_user.last_name,
-                    email=pending_user.email,
-                    role=chosen_role,
+            copy_columns = (
+                PendingUser.telegram_id,
+                PendingUser.username,
+                PendingUser.first_name,
+                PendingUser.last_name,
+                PendingUser.email,
+            )
+            moved = await self.session.execute(
+                insert(RegisteredUser).from_select(
+                    [column.key for column in copy_columns] + ["role"],
+                    select(*copy_columns, literal(chosen_role)).where(
+                        PendingUser.telegram_id == telegram_id
+                    ),
                 )
             )
-            await self.session.delete(pending_user)
-            logger.info(f"User {telegram_id} approved with role {chosen_role}")
+            if not moved.rowcount:
+                logger.warning("No pending user found for id {}", telegram_id)
+                return
+            await self.session.execute(
+                delete(PendingUser).where(PendingUser.telegram_id == telegram_id)
+            )
+            logger.info("User {} approved with role {}", telegram_id, chosen_role)
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to add pending user by id: {e}")
+            logger.error("❌ Failed to add pending user by id: {}", e)
             raise e
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise e
 
     async def ban_user(self, telegram_id: int) -> bool:
-        user_to_ban = await self.get_registered_user_by_id(telegram_id)
-        if not user_to_ban:
-            logger.warning(f"No user found with id: {telegram_id}")
-            return False
-
-        banned_user = BannedUser(
-            telegram_id=user_to_ban.telegram_id,
-            username=user_to_ban.username,
-            first_name=user_to_ban.first_name,
-            last_name=user_to_ban.last_name,
-            email=user_to_ban.email,
-        )
+        """Move a registered user to banned users with INSERT ... SELECT and DELETE.
+
+        Favorites are deleted explicitly because SQLite does not enforce the
+        ON DELETE CASCADE foreign key unless it is enabled per connection.
+        """
         try:
-            self.session.add(banned_user)
-            await self.session.delete(user_to_ban)
-            logger.info(f"User with id: {telegram_id} banned")
+            copy_columns = (
+                RegisteredUser.telegram_id,
+                RegisteredUser.username,
+                RegisteredUser.first_name,
+                RegisteredUser.last_name,
+                RegisteredUser.email,
+            )
+            moved = await self.session.execute(
+                insert(BannedUser).from_select(
+                    [column.key for column in copy_columns],
+                    select(*copy_columns).where(RegisteredUser.telegram_id == telegram_id),
+                )
+            )
+            if not moved.rowcount:
+                logger.warning("No user found with id: {}", telegram_id)
+                return False
+            await self.session.execute(
+                delete(FavoriteCarpets).where(FavoriteCarpets.user_id == telegram_id)
+            )
+            await self.session.execute(
+                delete(RegisteredUser).where(RegisteredUser.telegram_id == telegram_id)
+            )
+            logger.info("User with id: {} banned", telegram_id)
             return True
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get banned user by id: {e}")
+            logger.error("❌ Failed to get banned user by id: {}", e)
             raise e
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise e
 
+    async def _fetch_page_with_total(
+        self, query: Select, limit: int | None, offset: int
+    ) -> tuple[list[RegisteredUser], int]:
+        """Fetch one page of (user, COUNT(*) OVER ()) rows and split off the total.
+
+        A page past the end returns no rows to read the total from, so only then is
+        the count run as a separate query.
+        """
+        if limit:
+            query = query.limit(limit).offset(offset)
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not offset:
+            return [], 0
+        count_query = select(func.count()).select_from(query.limit(None).offset(None).subquery())
+        return [], await self.session.scalar(count_query)
+
     async def search_registered_users(
         self, search_query: str, limit: int = None, offset: int = 0
     ) -> tuple[list[RegisteredUser], int]:
         try:
+            # One bound pattern shared by all four columns
+            pattern = bindparam("pattern", f"%{search_query.strip()}%")
             base_query = (
-                select(RegisteredUser)
+                select(RegisteredUser, func.count().over().label("total"))
                 .where(
                     or_(
-                        RegisteredUser.phone.ilike(f"%{search_query}%"),
-                        RegisteredUser.username.ilike(f"%{search_query}%"),
-                        RegisteredUser.last_name.ilike(f"%{search_query}%"),
-                        RegisteredUser.email.ilike(f"%{search_query}%"),
+                        RegisteredUser.phone.ilike(pattern),
+                        RegisteredUser.username.ilike(pattern),
+                        RegisteredUser.last_name.ilike(pattern),
+                        RegisteredUser.email.ilike(pattern),
                     )
                 )
                 .order_by(RegisteredUser.first_name)
             )
 
-            count_query = select(func.count()).select_from(base_query.subquery())
-            total_count: int = await self.session.scalar(count_query)
-            if limit:
-                base_query = base_query.limit(limit).offset(offset)
-            result = await self.session.execute(base_query)
-            users = list(result.scalars().all())
-            return users, total_count
+            return await self._fetch_page_with_total(base_query, limit, offset)
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get selected registered user: {e}")
+            logger.error("❌ Failed to get selected registered user: {}", e)
             raise e
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise e
 
     async def get_all_registered_users_paginated(
@@ -152,19 +244,15 @@ class UserDAO:
     ) -> tuple[list[RegisteredUser], int]:
         """Get all registered users with pagination."""
         try:
-            count_query = select(func.count(RegisteredUser.telegram_id))
-            total_count = await self.session.scalar(count_query)
-            stmt = select(RegisteredUser).order_by(RegisteredUser.first_name)
-            if limit:
-                stmt = stmt.limit(limit).offset(offset)
-            result = await self.session.execute(stmt)
-            users = list(result.scalars().all())
-            return users, total_count
+            stmt = select(RegisteredUser, func.count().over().label("total")).order_by(
+                RegisteredUser.first_name
+            )
+            return await self._fetch_page_with_total(stmt, limit, offset)
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to get all registered users: {e}")
+            logger.error("❌ Failed to get all registered users: {}", e)
             raise
 
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: {}", e)
             raise
@@ -3,7 +3,6 @@ from collections.abc import AsyncGenerator
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -25,21 +24,28 @@ class Database:
             logger.warning("⚠️ Database engine already initialized")
             return
 
+        settings = base_settings.DATABASE
         self._engine = create_async_engine(
-            base_settings.DATABASE.url,
-            echo=base_settings.DATABASE.echo,
+            settings.url,
+            echo=settings.echo,
             future=True,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_recycle=settings.pool_recycle,
+            pool_pre_ping=settings.pool_pre_ping,
+            insertmanyvalues_page_size=settings.insertmanyvalues_page_size,
         )
         self._session_factory = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
 
         try:
-            async with self._engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+            # Fail fast on a bad URL; the checked-in connection stays pooled for first use
+            async with self._engine.connect() as conn:
+                await conn.exec_driver_sql("SELECT 1")
             logger.info("🔌 SQLAlchemy engine created")
         except Exception as e:
-            logger.error(f"❌ Database connection failed: {e}")
+            logger.error("❌ Database connection failed: {}", e)
             raise
 
     async def disconnect(self):
@@ -47,6 +53,7 @@ class Database:
             logger.warning("⚠️ No engine to dispose")
             return
 
+        logger.debug("📊 Connection pool at shutdown: {}", self._engine.pool.status())
         await self._engine.dispose()
         logger.info("🧯 SQLAlchemy engine disposed")
 
@@ -0,0 +1,46 @@
+"""Carpet filter indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, Sequence[str], None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLOR_COLUMNS = ("color_1", "color_2", "color_3")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "carpets_filter_idx",
+        "carpets",
+        ["collection", "geometry", "size", "style"],
+        postgresql_where=sa.text("quantity > 0"),
+        sqlite_where=sa.text("quantity > 0"),
+    )
+    for column in COLOR_COLUMNS:
+        op.create_index(
+            f"carpets_{column}_idx",
+            "carpets",
+            [column],
+            postgresql_where=sa.text(f"quantity > 0 AND {column} IS NOT NULL"),
+            sqlite_where=sa.text(f"quantity > 0 AND {column} IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(COLOR_COLUMNS):
+        op.drop_index(f"carpets_{column}_idx", table_name="carpets")
+    op.drop_index("carpets_filter_idx", table_name="carpets")
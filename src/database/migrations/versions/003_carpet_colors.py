@@ -0,0 +1,55 @@
+"""Carpet colors table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, Sequence[str], None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLOR_COLUMNS = ("color_1", "color_2", "color_3")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "carpet_colors",
+        sa.Column("color", sa.String(length=32), nullable=False),
+        sa.Column("carpet_id", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["carpet_id"], ["carpets.carpet_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("color", "carpet_id"),
+    )
+    # Backfill from the existing color columns; UNION drops a color repeated in two slots
+    op.execute(
+        "INSERT INTO carpet_colors (color, carpet_id) "
+        + " UNION ".join(
+            f"SELECT {column}, carpet_id FROM carpets WHERE {column} IS NOT NULL"
+            for column in COLOR_COLUMNS
+        )
+    )
+    # Color filters no longer read the color columns directly
+    for column in COLOR_COLUMNS:
+        op.drop_index(f"carpets_{column}_idx", table_name="carpets")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COLOR_COLUMNS:
+        op.create_index(
+            f"carpets_{column}_idx",
+            "carpets",
+            [column],
+            postgresql_where=sa.text(f"quantity > 0 AND {column} IS NOT NULL"),
+            sqlite_where=sa.text(f"quantity > 0 AND {column} IS NOT NULL"),
+        )
+    op.drop_table("carpet_colors")
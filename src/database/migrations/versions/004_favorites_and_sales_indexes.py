@@ -0,0 +1,29 @@
+"""Favorite carpets and sales indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, Sequence[str], None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("favorite_carpets_carpet_id_idx", "favorite_carpets", ["carpet_id"])
+    op.create_index("sales_carpet_date_idx", "sales", ["carpet_id", "sale_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("sales_carpet_date_idx", table_name="sales")
+    op.drop_index("favorite_carpets_carpet_id_idx", table_name="favorite_carpets")
@@ -0,0 +1,63 @@
+"""Favorite carpets composite primary key
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+import uuid
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, Sequence[str], None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite can't change a primary key in place, so batch mode rebuilds the table
+    with op.batch_alter_table("favorite_carpets", recreate="always") as batch_op:
+        batch_op.drop_constraint("uq_user_carpet", type_="unique")
+        batch_op.drop_column("id")
+        batch_op.create_primary_key("favorite_carpets_pkey", ["user_id", "carpet_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("favorite_carpets", recreate="always") as batch_op:
+        batch_op.add_column(sa.Column("id", sa.UUID(), nullable=True))
+
+    # Existing favorites get fresh ids
+    favorites = sa.table(
+        "favorite_carpets",
+        sa.column("id", sa.UUID()),
+        sa.column("user_id", sa.BigInteger()),
+        sa.column("carpet_id", sa.BigInteger()),
+    )
+    bind = op.get_bind()
+    keys = bind.execute(sa.select(favorites.c.user_id, favorites.c.carpet_id)).all()
+    if keys:
+        bind.execute(
+            favorites.update()
+            .where(
+                favorites.c.user_id == sa.bindparam("key_user_id"),
+                favorites.c.carpet_id == sa.bindparam("key_carpet_id"),
+            )
+            .values(id=sa.bindparam("new_id")),
+            [
+                {"key_user_id": user_id, "key_carpet_id": carpet_id, "new_id": uuid.uuid4()}
+                for user_id, carpet_id in keys
+            ],
+        )
+
+    with op.batch_alter_table("favorite_carpets", recreate="always") as batch_op:
+        batch_op.alter_column("id", type_=sa.UUID(), nullable=False)
+        batch_op.drop_constraint("favorite_carpets_pkey", type_="primary")
+        batch_op.create_primary_key("favorite_carpets_pkey", ["id"])
+        batch_op.create_unique_constraint("uq_user_carpet", ["user_id", "carpet_id"])
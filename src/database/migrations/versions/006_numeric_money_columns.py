@@ -0,0 +1,55 @@
+"""Numeric money columns
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SALES_COLUMNS = (
+    ("basic_price", sa.Numeric(12, 2)),
+    ("sale_price", sa.Numeric(12, 2)),
+    ("discount", sa.Numeric(5, 2)),
+)
+
+
+def _sales_reflect_args() -> list[sa.Column]:
+    """SQLite reflects UUID as NUMERIC, whose affinity would coerce hex ids that look numeric."""
+    return [sa.Column("sale_id", sa.UUID(), primary_key=True)]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("carpets") as batch_op:
+        batch_op.alter_column(
+            "price", existing_type=sa.Double(), type_=sa.Numeric(12, 2), existing_nullable=False
+        )
+    with op.batch_alter_table("sales", reflect_args=_sales_reflect_args()) as batch_op:
+        for column, numeric_type in SALES_COLUMNS:
+            batch_op.alter_column(
+                column, existing_type=sa.Double(), type_=numeric_type, existing_nullable=False
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("sales", reflect_args=_sales_reflect_args()) as batch_op:
+        for column, numeric_type in SALES_COLUMNS:
+            batch_op.alter_column(
+                column, existing_type=numeric_type, type_=sa.Double(), existing_nullable=False
+            )
+    with op.batch_alter_table("carpets") as batch_op:
+        batch_op.alter_column(
+            "price", existing_type=sa.Numeric(12, 2), type_=sa.Double(), existing_nullable=False
+        )
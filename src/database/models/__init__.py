@@ -1,4 +1,4 @@
-from .carpets import Carpet, FavoriteCarpets
+from .carpets import Carpet, CarpetColor, FavoriteCarpets
 from .sales import SalesData
 from .users import BannedUser, PendingUser, RegisteredUser
 
@@ -7,6 +7,7 @@ __all__ = [
     "RegisteredUser",
     "PendingUser",
     "Carpet",
+    "CarpetColor",
     "FavoriteCarpets",
     "SalesData",
 ]
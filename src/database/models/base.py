@@ -1,14 +1,77 @@
 import datetime
 import enum
+import operator
+import os
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
 
+from sqlalchemy import Column
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm.collections import InstrumentedList
 
+ColumnSpec = tuple[str, Callable[[Any], Any], Callable[[Any], Any] | None]
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so keys generated later
+    sort after earlier ones and new rows land at the end of the primary key index.
+    """
+    value = int.from_bytes(os.urandom(10)) & ((1 << 74) - 1)
+    rand_a, rand_b = value >> 62, value & ((1 << 62) - 1)
+    value = (time.time_ns() // 1_000_000) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
+
+def utcnow() -> datetime.datetime:
+    """Current UTC time, the client-side default for timestamp columns.
+
+    Filling timestamps in Python keeps them out of the post-INSERT/UPDATE fetch that
+    server-generated values need; the server defaults stay as a fallback for raw SQL.
+    """
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _isoformat(value: datetime.date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _enum_value(value: enum.Enum | None) -> Any:
+    return value.value if value is not None else None
+
+
+def _converter_for(column: Column) -> Callable[[Any], Any] | None:
+    """Pick the to_dict value converter from the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if issubclass(python_type, datetime.date):
+        return _isoformat
+    if issubclass(python_type, enum.Enum):
+        return _enum_value
+    return None
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     __abstract__ = True
 
+    @classmethod
+    def _column_specs(cls) -> tuple[ColumnSpec, ...]:
+        """Column name, getter and converter for each column, built once per class."""
+        specs = cls.__dict__.get("_column_specs_cache")
+        if specs is None:
+            specs = tuple(
+                (column.name, operator.attrgetter(column.name), _converter_for(column))
+                for column in cls.__table__.columns
+            )
+            cls._column_specs_cache = specs
+        return specs
+
     def to_dict(self, include_relations: bool = False, visited=None) -> dict:
         """
         Converts model instance to dict, optionally including relationships.
@@ -17,14 +80,10 @@ class Base(AsyncAttrs, DeclarativeBase):
         if visited is None:
             visited = set()
 
-        data = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, (datetime.date, datetime.datetime)):
-                value = value.isoformat()
-            elif isinstance(value, enum.Enum):
-                value = value.value
-            data[column.name] = value
+        data = {
+            name: convert(getter(self)) if convert else getter(self)
+            for name, getter, convert in self._column_specs()
+        }
 
         if include_relations:
             visited.add(id(self))
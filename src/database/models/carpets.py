@@ -1,21 +1,21 @@
-import uuid
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
-    UUID,
     BigInteger,
     DateTime,
-    Double,
     ForeignKey,
+    Index,
     Integer,
+    Numeric,
     String,
-    UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.models.base import Base
+from src.database.models.base import Base, utcnow
 
 if TYPE_CHECKING:
     from src.database.models.users import RegisteredUser
@@ -25,6 +25,18 @@ class Carpet(Base):
     """Carpet data."""
 
     __tablename__ = "carpets"
+    # Partial index over in-stock carpets backs the search filters and counts
+    __table_args__ = (
+        Index(
+            "carpets_filter_idx",
+            "collection",
+            "geometry",
+            "size",
+            "style",
+            postgresql_where=text("quantity > 0"),
+            sqlite_where=text("quantity > 0"),
+        ),
+    )
 
     carpet_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)  # manual id
     collection: Mapped[str] = mapped_column(String(64), nullable=False)
@@ -36,17 +48,39 @@ class Carpet(Base):
     color_3: Mapped[str] = mapped_column(String(32), nullable=True)
     style: Mapped[str] = mapped_column(String(32), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
-    price: Mapped[float] = mapped_column(Double, nullable=False)
+    price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        onupdate=utcnow,
+        nullable=False,
     )
 
     # Relations as a favorite carpet for user
     favorite_by: Mapped[list["FavoriteCarpets"]] = relationship(
-        "FavoriteCarpets", back_populates="carpet", cascade="all, delete-orphan"
+        "FavoriteCarpets",
+        back_populates="carpet",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+    )
+
+
+class CarpetColor(Base):
+    """One row per distinct color of a carpet, derived from color_1..color_3.
+
+    Rebuilt from the carpets table after every carpets sync, so color filters and
+    counts query a single indexed column instead of three.
+    """
+
+    __tablename__ = "carpet_colors"
+
+    color: Mapped[str] = mapped_column(String(32), primary_key=True)
+    carpet_id: Mapped[int] = mapped_column(
+        ForeignKey("carpets.carpet_id", ondelete="CASCADE"), primary_key=True
     )
 
 
@@ -54,19 +88,24 @@ class FavoriteCarpets(Base):
     """Many-to-many relationship between users and their favorite carpets."""
 
     __tablename__ = "favorite_carpets"
-    __table_args__ = (UniqueConstraint("user_id", "carpet_id", name="uq_user_carpet"),)
+    # The primary key also serves lookups by user; carpet_id gets its own index
+    # for cascading carpet deletes
+    __table_args__ = (Index("favorite_carpets_carpet_id_idx", "carpet_id"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("registered_users.telegram_id", ondelete="CASCADE"), nullable=False
+        ForeignKey("registered_users.telegram_id", ondelete="CASCADE"), primary_key=True
     )
     carpet_id: Mapped[int] = mapped_column(
-        ForeignKey("carpets.carpet_id", ondelete="CASCADE"), nullable=False
+        ForeignKey("carpets.carpet_id", ondelete="CASCADE"), primary_key=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
 
     # Relations
-    user: Mapped["RegisteredUser"] = relationship("RegisteredUser", back_populates="favorite")
-    carpet: Mapped["Carpet"] = relationship("Carpet", back_populates="favorite_by")
+    user: Mapped["RegisteredUser"] = relationship(
+        "RegisteredUser", back_populates="favorite", lazy="raise_on_sql"
+    )
+    carpet: Mapped["Carpet"] = relationship(
+        "Carpet", back_populates="favorite_by", lazy="raise_on_sql"
+    )
@@ -1,25 +1,26 @@
 import uuid
 from datetime import date
+from decimal import Decimal
 
-from sqlalchemy import UUID, Date, Double, ForeignKey, Integer, String, func
+from sqlalchemy import UUID, Date, ForeignKey, Index, Integer, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.database.models.base import Base
+from src.database.models.base import Base, uuid7
 
 
 class SalesData(Base):
     """Carpet sales data."""
 
     __tablename__ = "sales"
+    # Sales of a carpet, optionally over a date range
+    __table_args__ = (Index("sales_carpet_date_idx", "carpet_id", "sale_date"),)
 
-    sale_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
+    sale_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     sale_date: Mapped[date] = mapped_column(Date, server_default=func.now(), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     payment_method: Mapped[str] = mapped_column(String(32), nullable=False)
-    basic_price: Mapped[float] = mapped_column(Double, nullable=False)
-    sale_price: Mapped[float] = mapped_column(Double, nullable=False)
-    discount: Mapped[float] = mapped_column(Double, nullable=False)
+    basic_price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    sale_price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    discount: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
     sold_to: Mapped[str] = mapped_column(String(32), nullable=False)
     carpet_id: Mapped[int] = mapped_column(ForeignKey("carpets.carpet_id"), nullable=False)
@@ -1,10 +1,11 @@
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from sqlalchemy import BigInteger, DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.models.base import Base
+from src.database.models.base import Base, utcnow
 
 if TYPE_CHECKING:
     from src.database.models.carpets import FavoriteCarpets
@@ -23,15 +24,20 @@ class RegisteredUser(Base):
     phone: Mapped[str | None] = mapped_column(String(16), unique=True, nullable=True)
     role: Mapped[str] = mapped_column(String(32), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        onupdate=utcnow,
+        nullable=False,
     )
 
-    # Relations as a favorite carpet for user
+    # Relations as a favorite carpet for user. Relationships never load implicitly, so
+    # queries must eager-load what they need
     favorite: Mapped[list["FavoriteCarpets"]] = relationship(
-        "FavoriteCarpets", back_populates="user", cascade="all, delete-orphan"
+        "FavoriteCarpets", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
 
 
@@ -48,9 +54,14 @@ class PendingUser(Base):
     phone: Mapped[str | None] = mapped_column(String(16), unique=True, nullable=True)
     from_whom: Mapped[str] = mapped_column(String(100), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
 
+    @cached_property
+    def created_at_display(self) -> str:
+        """Application date formatted for admin dialogs."""
+        return self.created_at.strftime("%d.%m.%Y %H:%M")
+
 
 class BannedUser(Base):
     """Banned users from registered users."""
@@ -64,5 +75,5 @@ class BannedUser(Base):
     email: Mapped[str | None] = mapped_column(String(64), unique=False, nullable=True)
     phone: Mapped[str | None] = mapped_column(String(16), unique=True, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
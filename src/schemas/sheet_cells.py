@@ -0,0 +1,95 @@
+import re
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation
+from typing import TypeVar
+
+V = TypeVar("V")
+R = TypeVar("R")
+
+# Sheet cells mix separators and spacing; one translate pass normalizes them
+_SIZE_TRANS = str.maketrans({" ": None, ",": ".", "×": "x", "х": "x"})
+# ASCII digits only, so "١٢" is not stored as a distinct size; ".5" and "5." are accepted
+_SIZE_PART_RE = re.compile(r"(?=\.?[0-9])([0-9]*)(?:\.([0-9]*))?")
+_PRICE_TRANS = str.maketrans({"₽": None, " ": None, "\xa0": None, ",": "."})
+# Money columns are stored as Numeric with two decimal places
+CENTS = Decimal("0.01")
+
+
+def validate_cell(column: str, validator: Callable[[V], R], value: V) -> R:
+    """Run a cell validator and point its error at the sheet column.
+
+    msgspec turns ValueError raised in __post_init__ into a ValidationError with
+    the bare message; the suffix follows msgspec's own "- at `$.field`" format, so
+    every row error names its column the same way.
+
+    Args:
+        column: Sheet column title of the cell
+        validator: Callable that normalizes the value or raises ValueError
+        value: Raw cell value
+
+    Returns:
+        Normalized value
+
+    Raises:
+        ValueError: If the validator rejects the value
+    """
+    try:
+        return validator(value)
+    except ValueError as e:
+        raise ValueError(f"{e} - at `$.{column}`") from e
+
+
+def normalize_size(value: str | None) -> str:
+    """Normalize a "<width>x<height>" size cell, e.g. "2,50 Х 3" -> "2.5x3"."""
+    if value is None:
+        raise ValueError("Размер отсутствует")
+
+    raw_value = str(value).strip()
+    if not raw_value:
+        raise ValueError("Размер отсутствует")
+
+    cleaned = raw_value.casefold().translate(_SIZE_TRANS)
+
+    if cleaned.count("x") != 1:
+        raise ValueError("Размер должен содержать один разделитель 'x'")
+
+    width_raw, height_raw = cleaned.split("x")
+    return f"{_format_size_part(width_raw)}x{_format_size_part(height_raw)}"
+
+
+def parse_money(value: float | str | None) -> Decimal:
+    """Parse a price cell such as "12 000,50 ₽" into a Decimal rounded to cents."""
+    if value is None:
+        raise ValueError("Базовая стоимость отсутствует")
+    cleaned = str(value).translate(_PRICE_TRANS)
+    if not cleaned:
+        raise ValueError("Базовая стоимость отсутствует")
+    try:
+        money = Decimal(cleaned)
+    except InvalidOperation as exc:
+        raise ValueError("Не удалось преобразовать базовую стоимость в число") from exc
+    if not money.is_finite():
+        raise ValueError("Не удалось преобразовать базовую стоимость в число")
+    # Numeric(12, 2) holds at most 10 integer digits. Anything far beyond that would make
+    # quantize raise InvalidOperation, and rounding itself can carry into an 11th digit
+    if money and money.adjusted() > 9:
+        raise ValueError("Стоимость слишком большая")
+    money = money.quantize(CENTS)
+    if money and money.adjusted() > 9:
+        raise ValueError("Стоимость слишком большая")
+    return money
+
+
+def _format_size_part(raw_value: str) -> str:
+    if not raw_value:
+        raise ValueError("Размер содержит пустое значение")
+
+    match = _SIZE_PART_RE.fullmatch(raw_value)
+    if match is None:
+        raise ValueError("Размер должен содержать числовые значения")
+
+    # Drop insignificant zeros: "02.50" -> "2.5", "3.0" -> "3"
+    integer, fraction = match.groups()
+    integer = integer.lstrip("0") or "0"
+    fraction = (fraction or "").rstrip("0")
+    return f"{integer}.{fraction}" if fraction else integer
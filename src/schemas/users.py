@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+import msgspec
 
 
-class UserRegistrationInput(BaseModel):
+class UserRegistrationInput(msgspec.Struct, frozen=True, kw_only=True):
     telegram_id: int
     username: str | None = None
     first_name: str
@@ -12,10 +12,17 @@ from src.bot.dialogs.carpet_search import carpet_search_dialog
 from src.bot.dialogs.registration import registration_dialog, registration_router
 from src.bot.handlers.admin_menu import admin_menu_router
 from src.bot.handlers.start_command import start_command_router
+from src.bot.middlewares.db_session import DBSessionMiddleware
+from src.bot.middlewares.errors import ErrorMiddleware
 from src.core_settings import base_settings, bot, dp
 from src.database import db
 from src.logger import setup_logger
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not installed by default and unsupported on Windows
+    uvloop = None
+
 
 async def clear_commands_for_user(user_id: int):
     """Clear commands for a specific user."""
@@ -26,8 +33,8 @@ async def clear_commands_for_user(user_id: int):
         logger.debug(f"⚠️ Could not clear commands for user {user_id}: {e}")
 
 
-async def set_commands():
-    """Set bot commands depending on user type: an admin or a regular user."""
+async def _set_default_commands():
+    """Replace the default-scope commands; the delete must land before the set."""
     # Clear all existing commands first to ensure clean state
     try:
         await bot.delete_my_commands(scope=BotCommandScopeDefault())
@@ -45,20 +52,47 @@ async def set_commands():
     )
     logger.info("✅ Set default commands for all users")
 
+
+async def set_commands():
+    """Set bot commands depending on user type: an admin or a regular user.
+
+    Chat scopes do not depend on the default scope, so the admin overrides are sent
+    concurrently with the default commands instead of one round-trip at a time.
+    """
+    admin_ids = base_settings.ADMIN_IDS
     # Admin-specific commands (includes both start and admin)
-    if len(base_settings.ADMIN_IDS) > 0:
-        admin_commands = [
-            BotCommand(command="start", description="🚀 Главное меню"),
-            BotCommand(command="admin", description="👑 Панель администратора"),
-        ]
-        for admin_id in base_settings.ADMIN_IDS:
-            await bot.set_my_commands(
+    admin_commands = [
+        BotCommand(command="start", description="🚀 Главное меню"),
+        BotCommand(command="admin", description="👑 Панель администратора"),
+    ]
+    default_result, *admin_results = await asyncio.gather(
+        _set_default_commands(),
+        *(
+            bot.set_my_commands(
                 commands=admin_commands,
                 scope=BotCommandScopeChat(chat_id=admin_id),
             )
-            logger.info(f"✅ Set admin commands for admin: {admin_id}")
-    else:
+            for admin_id in admin_ids
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(default_result, BaseException):
+        raise default_result
+
+    if not admin_ids:
         logger.info("ℹ️ No admins configured, skipping admin command setup")
+    for admin_id, result in zip(admin_ids, admin_results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("❌ Could not set admin commands for admin {}: {}", admin_id, result)
+        else:
+            logger.info("✅ Set admin commands for admin: {}", admin_id)
+
+
+def register_middlewares():
+    # Outer middlewares run in registration order, so ErrorMiddleware wraps everything
+    dp.update.outer_middleware(ErrorMiddleware())
+    dp.update.outer_middleware(DBSessionMiddleware())
+    logger.info("🔗 Middlewares registered")
 
 
 def register_routers():
@@ -83,6 +117,7 @@ async def app_lifecycle():
     """Application lifecycle manager."""
     logger.info("🚀 Starting telegram-bot...")
     setup_logger()
+    register_middlewares()
     register_routers()
     register_dialogs()
     await set_commands()
@@ -104,6 +139,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("👋 Graceful shutdown requested by user (KeyboardInterrupt)")
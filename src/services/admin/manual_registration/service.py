@@ -3,6 +3,9 @@ from pydantic import ValidationError
 from src.services.admin.manual_registration.models import ManualUserRegistrationData
 from src.services.user_registration import ValidationResult
 
+# Compiled pydantic-core validator, looked up once instead of on every model build
+_VALIDATOR = ManualUserRegistrationData.__pydantic_validator__
+
 
 class ValidateManualRegistrationService:
     """Admin validation service using ManualUserRegistrationData."""
@@ -27,25 +30,29 @@ class ValidateManualRegistrationService:
     def validate_field(cls, field_name: str, value: str | int | None) -> ValidationResult:
         """Validate admin input field using ManualUserRegistrationData."""
         try:
-            payload: dict[str, object | None] = {}
             if isinstance(value, str) and value.strip() == "":
                 value = None
 
             if field_name == "telegram_id":
+                # A bare positive integer check; no model build needed
                 try:
-                    value = int(value)
+                    telegram_id = int(value)
                 except (TypeError, ValueError):
                     return ValidationResult(
                         is_valid=False,
                         error_message="Telegram ID должен быть целым положительным числом",
                         cleaned_value=None,
                     )
+                if telegram_id <= 0:
+                    return ValidationResult(
+                        is_valid=False,
+                        error_message="Telegram ID должен быть положительным числом",
+                        cleaned_value=None,
+                    )
+                return ValidationResult(is_valid=True, cleaned_value=str(telegram_id))
 
-            payload[field_name] = value
-            if field_name != "telegram_id":
-                payload["telegram_id"] = 1
-
-            validated = ManualUserRegistrationData(**payload)
+            # telegram_id is required by the model, so a placeholder stands in for it
+            validated = _VALIDATOR.validate_python({"telegram_id": 1, field_name: value})
             cleaned_value = getattr(validated, field_name, None)
             return ValidationResult(
                 is_valid=True,
@@ -1,11 +1,38 @@
 import dataclasses
-from typing import List
+import functools
+from typing import ClassVar, List
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from src.database.models.users import PendingUser
 
 
+def _build_admin_menu_keyboard() -> InlineKeyboardMarkup:
+    """Build main admin menu keyboard."""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="⏳ Заявки на регистрацию", callback_data="admin_pending_users"
+                )
+            ],
+            [InlineKeyboardButton(text="➕ Добавить пользователя", callback_data="admin_add_user")],
+            [
+                InlineKeyboardButton(
+                    text="🚫 Заблокировать пользователя", callback_data="admin_ban_user"
+                )
+            ],
+            [InlineKeyboardButton(text="📢 Рассылка", callback_data="admin_broadcast")],
+            [
+                InlineKeyboardButton(
+                    text="🔄 Синхронизация Google Таблиц",
+                    callback_data="admin_sync_google_sheets",
+                )
+            ],
+        ]
+    )
+
+
 @dataclasses.dataclass
 class AdminMessages:
     """Centralized messages for admin functionality."""
@@ -165,35 +192,8 @@ class AdminMessages:
     btn_sync_carpets: str = "🧿 Ковры"
     btn_sync_sales: str = "💰 Продажи"
 
-    @staticmethod
-    def get_admin_menu_keyboard() -> InlineKeyboardMarkup:
-        """Get main admin menu keyboard."""
-        return InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(
-                        text="⏳ Заявки на регистрацию", callback_data="admin_pending_users"
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        text="➕ Добавить пользователя", callback_data="admin_add_user"
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        text="🚫 Заблокировать пользователя", callback_data="admin_ban_user"
-                    )
-                ],
-                [InlineKeyboardButton(text="📢 Рассылка", callback_data="admin_broadcast")],
-                [
-                    InlineKeyboardButton(
-                        text="🔄 Синхронизация Google Таблиц",
-                        callback_data="admin_sync_google_sheets",
-                    )
-                ],
-            ]
-        )
+    # Static keyboards are built once and shared by every render
+    ADMIN_MENU_KEYBOARD: ClassVar[InlineKeyboardMarkup] = _build_admin_menu_keyboard()
 
     @staticmethod
     def get_pending_users_keyboard(users: List[PendingUser]) -> InlineKeyboardMarkup:
@@ -237,6 +237,7 @@ class AdminMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_role_selection_keyboard() -> InlineKeyboardMarkup:
         """Get role selection keyboard."""
         return InlineKeyboardMarkup(
@@ -249,6 +250,7 @@ class AdminMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
         """Get confirmation keyboard."""
         return InlineKeyboardMarkup(
@@ -263,6 +265,7 @@ class AdminMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_skip_keyboard() -> InlineKeyboardMarkup:
         """Get skip keyboard for optional fields."""
         return InlineKeyboardMarkup(
@@ -273,6 +276,7 @@ class AdminMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_table_selection_keyboard() -> InlineKeyboardMarkup:
         """Get a table selection keyboard for Google Sheets sync."""
         return InlineKeyboardMarkup(
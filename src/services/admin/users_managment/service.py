@@ -28,10 +28,10 @@ class AdminUserManagementService:
             statement = select(PendingUser).order_by(PendingUser.created_at.desc())
             result = await self.session.execute(statement)
             pending_users = result.scalars().all()
-            logger.info(f"📋 Retrieved {len(pending_users)} pending users")
+            logger.info("📋 Retrieved {} pending users", len(pending_users))
             return list(pending_users)
         except Exception as e:
-            logger.error(f"❌ Error getting pending users: {e}")
+            logger.error("❌ Error getting pending users: {}", e)
             raise e
 
     async def approve_pending_user(
@@ -47,21 +47,19 @@ class AdminUserManagementService:
             Tuple of (success, a message)
         """
         try:
-            pending_user = await self.user_dao.get_pending_user_by_id(telegram_id)
-            if not pending_user:
+            status = await self.user_dao.get_existing_user_status(telegram_id)
+            if status == "registered":
+                return False, messages.already_registered
+            if status != "pending":
                 return False, messages.not_in_pending_list
 
-            existing_user = await self.user_dao.get_registered_user_by_id(telegram_id)
-            if existing_user:
-                return False, messages.user_already_registered
-
             await self.user_dao.approve_user(telegram_id, role)
             await self._notify_user(telegram_id, UserReviewStatus.APPROVED)
-            logger.info(f"✅ User {telegram_id} approved with role {role}")
+            logger.info("✅ User {} approved with role {}", telegram_id, role)
             return True, messages.admin_approve_message(role)
 
         except Exception as e:
-            logger.error(f"❌ Error approving pending user {telegram_id}: {e}")
+            logger.error("❌ Error approving pending user {}: {}", telegram_id, e)
             return False, messages.error_in_approval_process
 
     async def reject_pending_user(
@@ -84,12 +82,12 @@ class AdminUserManagementService:
             await self.session.delete(pending_user)
             await self._notify_user(telegram_id, UserReviewStatus.REJECTED, reason)
             logger.info(
-                f"⚠️ User {telegram_id} registration recjected successfully. Reason: {reason}"
+                "⚠️ User {} registration recjected successfully. Reason: {}", telegram_id, reason
             )
             return True, messages.admin_reject_message(reason)
 
         except Exception as e:
-            logger.error(f"❌ Error rejecting pending user {telegram_id}: {e}")
+            logger.error("❌ Error rejecting pending user {}: {}", telegram_id, e)
             return False, messages.error_in_reject_process
 
     async def add_user_manually(
@@ -115,16 +113,12 @@ class AdminUserManagementService:
             Tuple of (success, a message)
         """
         try:
-            existing_user = await self.user_dao.get_registered_user_by_id(telegram_id)
-            if existing_user:
-                return False, messages.user_already_registered
-
-            pending_user = await self.user_dao.get_pending_user_by_id(telegram_id)
-            if pending_user:
-                return False, messages.user_already_pending
-
-            banned_user = await self.user_dao.get_banned_user_by_id(telegram_id)
-            if banned_user:
+            status = await self.user_dao.get_existing_user_status(telegram_id)
+            if status == "registered":
+                return False, messages.already_registered
+            if status == "pending":
+                return False, messages.already_pending
+            if status == "banned":
                 return False, messages.already_banned
 
             new_user = RegisteredUser(
@@ -137,11 +131,11 @@ class AdminUserManagementService:
             )
             self.session.add(new_user)
             await self._notify_user(telegram_id, UserReviewStatus.ADDED_MANUALLY)
-            logger.info(f"✅ User {telegram_id} manually added with role {role}")
+            logger.info("✅ User {} manually added with role {}", telegram_id, role)
             return True, f"Пользователь добавлен с ролью: {role}"
 
         except Exception as e:
-            logger.error(f"❌ Error manually adding user {telegram_id}: {e}")
+            logger.error("❌ Error manually adding user {}: {}", telegram_id, e)
             return False, "Ошибка при добавлении пользователя"
 
     async def ban_user(self, telegram_id: int, reason: str | None = None) -> tuple[bool, str]:
@@ -161,11 +155,11 @@ class AdminUserManagementService:
 
             await self._clear_user_state(telegram_id)
             await self._notify_user(telegram_id, UserReviewStatus.BANNED, reason)
-            logger.info(f"🚫 User {telegram_id} banned")
+            logger.info("🚫 User {} banned", telegram_id)
             return True, messages.admin_ban_message(reason)
 
         except Exception as e:
-            logger.error(f"❌ Error banning user {telegram_id}: {e}")
+            logger.error("❌ Error banning user {}: {}", telegram_id, e)
             return False, messages.error_in_ban_process
 
     async def get_all_registered_users_paginated(
@@ -196,7 +190,7 @@ class AdminUserManagementService:
             total_pages = (total_count + page_size - 1) // page_size
             return users, total_count, total_pages
         except Exception as e:
-            logger.error(f"❌ Error getting users: {e}")
+            logger.error("❌ Error getting users: {}", e)
             raise
 
     async def broadcast_message_to_registered_users(self, message: str) -> tuple[int, int]:
@@ -212,7 +206,7 @@ class AdminUserManagementService:
         if not registered_users:
             return 0, 0
 
-        logger.info(f"📢 Broadcasting message to {len(registered_users)} users")
+        logger.info("📢 Broadcasting message to {} users", len(registered_users))
         successful_sends = 0
         failed_sends = 0
 
@@ -234,11 +228,13 @@ class AdminUserManagementService:
                         failed_sends += 1
                 if i + batch_size < len(registered_users):
                     await asyncio.sleep(1)
-            logger.info(f"📢 Broadcast completed: {successful_sends} sent, {failed_sends} failed")
+            logger.info(
+                "📢 Broadcast completed: {} sent, {} failed", successful_sends, failed_sends
+            )
             return successful_sends, failed_sends
 
         except Exception as e:
-            logger.error(f"❌ Error broadcasting message: {e}")
+            logger.error("❌ Error broadcasting message: {}", e)
             raise e
 
     async def notify_admins_new_registration(
@@ -256,8 +252,9 @@ class AdminUserManagementService:
         results = await asyncio.gather(*tasks, return_exceptions=True)
         successful_notifications = sum(1 for result in results if result is True) + 1
         logger.info(
-            f"📬 Notified {successful_notifications}/{len(admin_ids)} admins"
-            f" about new registration"
+            "📬 Notified {}/{} admins about new registration",
+            successful_notifications,
+            len(admin_ids),
         )
 
     async def _notify_user(
@@ -281,7 +278,7 @@ class AdminUserManagementService:
                 parse_mode="HTML",
             )
         except Exception as e:
-            logger.warning(f"⚠️ Failed to send message to user {telegram_id}: {e}")
+            logger.warning("⚠️ Failed to send message to user {}: {}", telegram_id, e)
 
     async def _clear_user_state(self, telegram_id: int):
         """Clear the user's FSM state and dialog history."""
@@ -290,6 +287,6 @@ class AdminUserManagementService:
                 bot=self.bot, user_id=telegram_id, chat_id=telegram_id
             )
             await fsm_context.clear()
-            logger.debug(f"🧹 Cleared state for banned user {telegram_id}")
+            logger.debug("🧹 Cleared state for banned user {}", telegram_id)
         except Exception as e:
-            logger.warning(f"⚠️ Failed to clear state for user {telegram_id}: {e}")
+            logger.warning("⚠️ Failed to clear state for user {}: {}", telegram_id, e)
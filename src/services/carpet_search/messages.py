@@ -45,6 +45,7 @@ class CarpetSearchMessages:
     results_title: str = "📋 <b>Результаты поиска</b>"
     no_results_text: str = "😔 По вашим критериям ковры не найдены. Попробуйте изменить фильтры."
     results_summary_format: str = "Найдено ковров: <b>{count}</b>"
+    result_separator: str = "━━━━━━━━━━━━━━━\n"
 
     # Error messages
     error_loading_filters: str = "❌ Ошибка загрузки фильтров"
@@ -71,7 +72,7 @@ class CarpetSearchMessages:
         return text
 
     def get_filter_selection_text(
-        self, filter_type: str, selected_count: int, total_options: int
+        self, filter_type: str, selected_count: int, total_options: int, total_carpets: int
     ) -> str:
         """Get filter selection text with selection info."""
         base_text = self.filter_selection_texts.get(filter_type, "Выберите опции:")
@@ -81,6 +82,8 @@ class CarpetSearchMessages:
         else:
             base_text += f"\n\n📊 Доступно опций: <b>{total_options}</b>"
 
+        base_text += f"\n🔍 Найдено ковров: <b>{total_carpets}</b>"
+
         return base_text
 
     def format_carpet_result(self, carpet) -> str:
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -36,6 +36,10 @@ class CarpetFilters(BaseModel):
             if getattr(self, field)
         }
 
+    def cache_key(self) -> Tuple[Tuple[str, ...], ...]:
+        """Get a hashable key that is independent of selection order."""
+        return tuple(tuple(sorted(getattr(self, field))) for field in self._filter_labels)
+
     def clear_filter(self, filter_type: str) -> None:
         """Clear specific filter type."""
         if filter_type in self._filter_labels:
@@ -59,5 +63,4 @@ class FilterResults(BaseModel):
     """Model for filter results."""
 
     options: List[FilterOption]
-    total_carpets: int
     filter_type: str
@@ -3,11 +3,29 @@ from typing import Any, List, Sequence
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import TTLCache
 from src.core_settings import base_settings
-from src.dao.carpets import CarpetsDAO
+from src.dao.carpets import CarpetsDAO, clear_unique_values_cache
 from src.database.models.carpets import Carpet
 from src.services.carpet_search.models import CarpetFilters, FilterOption, FilterResults
 
+# Counts and options are redrawn on every window repaint, so identical filter sets share
+# one result. Both caches are dropped after a carpets sync via invalidate_search_caches().
+_count_cache: TTLCache[int] = TTLCache(maxsize=1024, ttl=60)
+_options_cache: TTLCache[list[tuple[str, int]]] = TTLCache(maxsize=1024, ttl=30)
+# Bumped on every invalidation, so a query started before a sync cannot store stale results
+_cache_generation = 0
+
+
+def invalidate_search_caches() -> None:
+    """Drop cached counts and filter values after carpets data has changed."""
+    global _cache_generation
+    _cache_generation += 1
+    _count_cache.clear()
+    _options_cache.clear()
+    clear_unique_values_cache()
+    logger.debug("🧹 Carpet search caches cleared")
+
 
 # TODO Check this implementation
 class CarpetSearchService:
@@ -29,29 +47,70 @@ class CarpetSearchService:
             current_filters: Current filter selections
 
         Returns:
-            FilterResults with available options and counts
+            FilterResults with available options and their counts
         """
+        cache_key = (filter_type, current_filters.cache_key())
         try:
-            filters_dict = current_filters.model_dump()
-            options_with_counts = await self.carpets_dao.get_filtered_unique_values(
-                field_name=filter_type, existing_filters=filters_dict
-            )
+            options_with_counts = _options_cache.get(cache_key)
+            if options_with_counts is None:
+                generation = _cache_generation
+                filters_dict = current_filters.model_dump()
+                options_with_counts = await self.carpets_dao.get_filtered_unique_values(
+                    field_name=filter_type, existing_filters=filters_dict
+                )
+                # Skip caching when a sync invalidated the caches while this query ran
+                if generation == _cache_generation:
+                    _options_cache.set(cache_key, options_with_counts)
+
             current_selections = getattr(current_filters, filter_type, [])
             options = [
                 FilterOption(value=value, count=count, selected=value in current_selections)
                 for value, count in options_with_counts
             ]
 
-            # Get total carpet count with current filters
-            total_carpets = await self.carpets_dao.count_filtered_carpets(filters_dict)
+            return FilterResults(options=options, filter_type=filter_type)
 
-            return FilterResults(
-                options=options, total_carpets=total_carpets, filter_type=filter_type
-            )
+        except Exception as e:
+            logger.error("❌ Error getting filter options for {}: {}", filter_type, e)
+            return FilterResults(options=[], filter_type=filter_type)
+
+    async def prefetch_filter_options(self, current_filters: CarpetFilters) -> None:
+        """Warm the options cache of every filter type with a single query.
 
+        Args:
+            current_filters: Current filter selections
+        """
+        filters_key = current_filters.cache_key()
+        generation = _cache_generation
+        try:
+            values_by_field = await self.carpets_dao.get_all_filtered_unique_values(
+                current_filters.model_dump()
+            )
         except Exception as e:
-            logger.error(f"❌ Error getting filter options for {filter_type}: {e}")
-            return FilterResults(options=[], total_carpets=0, filter_type=filter_type)
+            logger.error("❌ Error prefetching filter options: {}", e)
+            return
+
+        if generation != _cache_generation:
+            logger.debug("⏭️ Carpets changed during prefetch; options not cached")
+            return
+        for filter_type, options_with_counts in values_by_field.items():
+            _options_cache.set((filter_type, filters_key), options_with_counts)
+
+    @staticmethod
+    def has_cached_filter_options(current_filters: CarpetFilters) -> bool:
+        """Check whether the options of every filter type are already cached.
+
+        Args:
+            current_filters: Current filter selections
+
+        Returns:
+            True if no filter window would need a database query
+        """
+        filters_key = current_filters.cache_key()
+        return all(
+            _options_cache.get((filter_type, filters_key)) is not None
+            for filter_type in CarpetFilters.model_fields
+        )
 
     async def search_carpets(
         self, current_filters: CarpetFilters, limit: int = 50, offset: int = 0
@@ -73,9 +132,32 @@ class CarpetSearchService:
             )
 
         except Exception as e:
-            logger.error(f"❌ Error searching carpets: {e}")
+            logger.error("❌ Error searching carpets: {}", e)
             return []
 
+    async def search_with_count(
+        self, current_filters: CarpetFilters, limit: int = 50, offset: int = 0
+    ) -> tuple[list[Carpet], int]:
+        """Search carpets and count all matches with one database round trip.
+
+        Args:
+            current_filters: Current filter selections
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Tuple of (matching Carpet objects, total number of matching carpets)
+        """
+        try:
+            filters_dict = current_filters.model_dump()
+            return await self.carpets_dao.search_carpets_with_count(
+                filters=filters_dict, limit=limit, offset=offset
+            )
+
+        except Exception as e:
+            logger.error("❌ Error searching carpets with count: {}", e)
+            return [], 0
+
     async def count_filtered_carpets(self, current_filters: CarpetFilters) -> int:
         """Count carpets matching current filters.
 
@@ -85,12 +167,22 @@ class CarpetSearchService:
         Returns:
             Number of carpets matching filters
         """
+        cache_key = current_filters.cache_key()
+        cached = _count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
+            generation = _cache_generation
             filters_dict = current_filters.model_dump()
-            return await self.carpets_dao.count_filtered_carpets(filters_dict)
+            total = await self.carpets_dao.count_filtered_carpets(filters_dict)
+            # Skip caching when a sync invalidated the caches while this query ran
+            if generation == _cache_generation:
+                _count_cache.set(cache_key, total)
+            return total
 
         except Exception as e:
-            logger.error(f"❌ Error counting filtered carpets: {e}")
+            logger.error("❌ Error counting filtered carpets: {}", e)
             return 0
 
     @staticmethod
@@ -1,15 +1,44 @@
+import asyncio
+import random
 from pathlib import Path
 
+import gspread
 import gspread_asyncio
+import requests
 from google.oauth2.service_account import Credentials
 from loguru import logger
 
 from src.core_settings import GOOGLE_SCOPES, base_settings
 
+FETCH_MAX_ATTEMPTS = 5
+FETCH_BACKOFF_CAP = 60.0
+
+
+class _FailFastClientManager(gspread_asyncio.AsyncioGspreadClientManager):
+    """Client manager that raises API errors instead of retrying them forever.
+
+    The default handlers sleep a fixed delay and retry without limit, which hides
+    rate limiting from the caller. Retries are done in AsyncSheetClient instead.
+    """
+
+    async def handle_gspread_error(self, e, method, args, kwargs):
+        raise e
+
+    async def handle_requests_error(self, e, method, args, kwargs):
+        raise e
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limiting, server-side errors and network failures are worth retrying."""
+    if isinstance(error, gspread.exceptions.APIError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, requests.RequestException)
+
 
 class AsyncSheetClient:
     def __init__(self):
-        self._manager = gspread_asyncio.AsyncioGspreadClientManager(self._create_creds)
+        self._manager = _FailFastClientManager(self._create_creds)
 
     @staticmethod
     def _create_creds():
@@ -22,8 +51,29 @@ class AsyncSheetClient:
     async def fetch_all(
         self, spreadsheet_id: str, worksheet_title: str | None = None
     ) -> list[list[str]]:
-        """Fetch all rows and columns from a worksheet."""
+        """Fetch all rows and columns from a worksheet.
+
+        Transient failures are retried with capped exponential backoff and jitter.
+        """
+        for attempt in range(FETCH_MAX_ATTEMPTS):
+            try:
+                return await self._fetch_all_once(spreadsheet_id, worksheet_title)
+            except Exception as e:
+                if attempt == FETCH_MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = min(FETCH_BACKOFF_CAP, 2**attempt) + random.random()
+                logger.warning(
+                    "⏳ Sheets request failed ({!r}), retry {}/{} in {:.1f}s",
+                    e,
+                    attempt + 1,
+                    FETCH_MAX_ATTEMPTS - 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
 
+    async def _fetch_all_once(
+        self, spreadsheet_id: str, worksheet_title: str | None
+    ) -> list[list[str]]:
         logger.info(f"📑 Fetching ALL values from sheet {worksheet_title or 'default[0]'}")
         try:
             gc = await self._manager.authorize()
@@ -55,6 +105,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -2,14 +2,15 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
+import msgspec
 from loguru import logger
-from pydantic import BaseModel
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.services.google_sheets.async_client import AsyncSheetClient
 from src.services.google_sheets.utils import parse_table_from_google_sheets
 
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T", bound=msgspec.Struct)
 K = TypeVar("K")  # Key type
 E = TypeVar("E")  # Entity type
 
@@ -38,14 +39,12 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
     def __init__(self, session: AsyncSession, sheet_client: AsyncSheetClient | None = None):
         self.session = session
         self.sheet_client = sheet_client or AsyncSheetClient()
-        self._field_alias_map = {
-            name: field.alias or name
-            for name, field in self.get_schema_model().model_fields.items()
-        }
+        # Keys of the valid rows seen by the last sync_data call
+        self.synced_keys: set[K] = set()
 
     @abstractmethod
     def get_schema_model(self) -> type[T]:
-        """Return the Pydantic schema model for this service."""
+        """Return the msgspec schema struct for this service."""
         pass
 
     @abstractmethod
@@ -69,8 +68,8 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
         pass
 
     @abstractmethod
-    def create_entity(self, payload: dict[str, Any]) -> E:
-        """Create new entity instance from payload."""
+    def get_entity_model(self) -> type[E]:
+        """Return the ORM model that new payloads are inserted into."""
         pass
 
     @abstractmethod
@@ -82,6 +81,7 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
         self, spreadsheet_id: str, worksheet_title: str | None = None
     ) -> SyncResult:
         """Synchronize data from Google Sheets to database."""
+        self.synced_keys = set()
         values = await self.sheet_client.fetch_all(spreadsheet_id, worksheet_title)
         entity_name = self.get_entity_name()
 
@@ -130,16 +130,17 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
             )
 
         existing_records = await self.load_existing_records()
-        inserted = updated = skipped = 0
+        new_payloads: list[dict[str, Any]] = []
+        updated = skipped = 0
 
         for row in valid_rows:
             payload = self.row_to_payload(row)
             key = self.extract_key_from_payload(payload)
+            self.synced_keys.add(key)
             record = existing_records.get(key)
 
             if record is None:
-                self.session.add(self.create_entity(payload))
-                inserted += 1
+                new_payloads.append(payload)
                 logger.debug(f"➕ New {entity_name.lower()} scheduled for insert: {key}")
                 continue
 
@@ -152,6 +153,11 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
                 skipped += 1
                 logger.debug(f"⏭️ {entity_name} unchanged: {key}")
 
+        if new_payloads:
+            # One ORM bulk INSERT; SQLAlchemy sends it as paged multi-row VALUES statements
+            await self.session.execute(insert(self.get_entity_model()), new_payloads)
+        inserted = len(new_payloads)
+
         total_rows = len(valid_rows) + len(invalid_rows)
         bad_data = total_rows - inserted - updated - skipped
         logger.info(
@@ -184,9 +190,9 @@ class BaseGoogleSheetsService(ABC, Generic[T, K, E]):
             messages: list[str] = []
             for error in errors:
                 loc = error.get("loc", ())
-                field_name = loc[-1] if loc else "unknown"
-                alias = self._field_alias_map.get(field_name, str(field_name))
-                messages.append(f"{alias}: {error.get('msg')}")
+                # Error locations are already sheet column titles
+                column = loc[-1] if loc else "unknown"
+                messages.append(f"{column}: {error.get('msg')}")
 
             row_preview = ", ".join(cell for cell in raw_data if cell) or "пустая строка"
             lines.append(f"• Строка {row_number}: {'; '.join(messages)}")
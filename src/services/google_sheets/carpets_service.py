@@ -3,6 +3,7 @@ from typing import Any
 from loguru import logger
 from sqlalchemy import delete, select
 
+from src.dao.carpets import CarpetsDAO
 from src.database.models.carpets import Carpet
 from src.schemas.carpers_from_google_sh import CarpetRowFromGoogleSheets
 from src.services.google_sheets.base_service import BaseGoogleSheetsService, SyncResult
@@ -40,31 +41,15 @@ class GoogleSheetsCarpetService(BaseGoogleSheetsService[CarpetRowFromGoogleSheet
             "color_3": row.color_3 or None,
             "style": row.style,
             "quantity": row.quantity,
-            "price": float(row.base_price),
+            "price": row.base_price,
         }
 
-    def create_entity(self, payload: dict[str, Any]) -> Carpet:
-        return Carpet(**payload)
+    def get_entity_model(self) -> type[Carpet]:
+        return Carpet
 
     def has_changes(self, carpet: Carpet, payload: dict[str, Any]) -> bool:
-        for field, new_value in payload.items():
-            current_value = getattr(carpet, field)
-            if field == "price":
-
-                # Compare floats with tolerance to avoid noisy updates
-                if current_value is None and new_value is not None:
-                    return True
-                if new_value is None and current_value is not None:
-                    return True
-                if (
-                    current_value is not None
-                    and abs(float(current_value) - float(new_value)) > 1e-6
-                ):
-                    return True
-            else:
-                if current_value != new_value:
-                    return True
-        return False
+        # Prices are Decimals at the column's scale on both sides, so plain equality works
+        return any(getattr(carpet, field) != new_value for field, new_value in payload.items())
 
     async def sync_data(
         self, spreadsheet_id: str, worksheet_title: str | None = None
@@ -77,25 +62,9 @@ class GoogleSheetsCarpetService(BaseGoogleSheetsService[CarpetRowFromGoogleSheet
         if result.total_rows == 0:
             return result
 
-        # Load existing records and determine which ones to delete
-        existing_records = await self.load_existing_records()
-
-        # Get carpet IDs from the sheet data
-        values = await self.sheet_client.fetch_all(spreadsheet_id, worksheet_title)
-        if not values or len(values) < 2:
-            return result
-
-        header, *rows = values
-        from src.services.google_sheets.utils import parse_table_from_google_sheets
-
-        valid_rows, _ = parse_table_from_google_sheets(
-            rows=rows,
-            header=header,
-            model=self.get_schema_model(),
-        )
-
-        sheet_carpet_ids = {row.carpet_id for row in valid_rows}
-        carpet_ids_to_delete = set(existing_records.keys()) - sheet_carpet_ids
+        # The sheet was fetched and parsed once above; its carpet IDs came along
+        stored_carpet_ids = set(await self.session.scalars(select(Carpet.carpet_id)))
+        carpet_ids_to_delete = stored_carpet_ids - self.synced_keys
 
         # Delete carpets that are no longer in the sheet
         deleted_count = 0
@@ -106,6 +75,9 @@ class GoogleSheetsCarpetService(BaseGoogleSheetsService[CarpetRowFromGoogleSheet
             deleted_count = delete_result.rowcount or 0
             logger.info(f"🗑️ Deleted {deleted_count} carpet(s) from database")
 
+        if result.has_changes or deleted_count:
+            await CarpetsDAO(self.session).rebuild_carpet_colors()
+
         # Return updated result with deletion count
         return SyncResult(
             entity_name=result.entity_name,
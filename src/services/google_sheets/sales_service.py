@@ -36,33 +36,18 @@ class GoogleSheetsSalesService(
             "sale_date": row.sale_date,
             "quantity": row.quantity,
             "payment_method": row.payment_method.value,  # Convert enum to string
-            "basic_price": float(row.basic_price),
-            "sale_price": float(row.sale_price),
+            "basic_price": row.basic_price,
+            "sale_price": row.sale_price,
             "discount": row.discount,
             "sold_to": row.sold_to or "Unknown",  # Handle None case
         }
 
-    def create_entity(self, payload: dict[str, Any]) -> SalesData:
-        return SalesData(**payload)
+    def get_entity_model(self) -> type[SalesData]:
+        return SalesData
 
     def has_changes(self, sale: SalesData, payload: dict[str, Any]) -> bool:
-        for field, new_value in payload.items():
-            current_value = getattr(sale, field)
-            if field in ("basic_price", "sale_price", "discount"):
-                # Compare floats with tolerance to avoid noisy updates
-                if current_value is None and new_value is not None:
-                    return True
-                if new_value is None and current_value is not None:
-                    return True
-                if (
-                    current_value is not None
-                    and abs(float(current_value) - float(new_value)) > 1e-6
-                ):
-                    return True
-            else:
-                if current_value != new_value:
-                    return True
-        return False
+        # Money columns read back as two-place Decimals, the same as the parsed row
+        return any(getattr(sale, field) != new_value for field, new_value in payload.items())
 
     async def sync_sales(
         self, spreadsheet_id: str, worksheet_title: str | None = None
@@ -1,9 +1,21 @@
+import re
+from functools import partial
 from typing import Any, TypeVar
 
+import msgspec
 from loguru import logger
-from pydantic import BaseModel, ValidationError
 
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T", bound=msgspec.Struct)
+
+# msgspec appends the offending column as " - at `$.<column title>`"
+_ERROR_LOCATION_RE = re.compile(r"^(?P<msg>.*?)(?: - at `\$\.(?P<column>[^`]+)`)?$", re.DOTALL)
+
+
+def _error_details(error: msgspec.ValidationError) -> dict[str, Any]:
+    """Split a msgspec validation error into its column and message."""
+    match = _ERROR_LOCATION_RE.match(str(error))
+    column = match["column"]
+    return {"loc": (column,) if column else (), "msg": match["msg"]}
 
 
 def parse_table_from_google_sheets(
@@ -16,7 +28,7 @@ def parse_table_from_google_sheets(
     Args:
         rows: List of row data from Google Sheets
         header: Header row with column names
-        model: Pydantic model class to validate data
+        model: msgspec Struct class whose field names are renamed to column titles
 
     Returns:
         Tuple of (valid_rows, invalid_rows) where invalid_rows contains error details
@@ -24,20 +36,25 @@ def parse_table_from_google_sheets(
     passed_values: list[T] = []
     failed_values: list[dict[str, Any]] = []
     idx = {name: i for i, name in enumerate(header)}
+    columns = [
+        (field.encode_name, idx[field.encode_name])
+        for field in msgspec.structs.fields(model)
+        if field.encode_name in idx
+    ]
+    # Sheet cells are strings, so lax mode lets msgspec parse numbers and dates
+    convert = partial(msgspec.convert, type=model, strict=False)
 
     for row_number, raw_data in enumerate(rows, start=2):
-        data: dict[str, str | None] = {}
-        for _, field in model.model_fields.items():
-            alias = field.alias
-            i = idx.get(alias)
-            if i is not None:
-                data[alias] = (
-                    raw_data[i].strip() if i < len(raw_data) and raw_data[i] is not None else None
-                )
-                logger.debug(f"[{row_number}] {alias}: {data[alias]}")
+        data: dict[str, str | None] = {
+            alias: raw_data[i].strip() if i < len(raw_data) and raw_data[i] is not None else None
+            for alias, i in columns
+        }
+        logger.debug("[{}] {}", row_number, data)
         try:
-            passed_values.append(model(**data))
-        except ValidationError as e:
-            failed_values.append({"row": row_number, "errors": e.errors(), "raw_data": raw_data})
+            passed_values.append(convert(data))
+        except msgspec.ValidationError as e:
+            failed_values.append(
+                {"row": row_number, "errors": [_error_details(e)], "raw_data": raw_data}
+            )
 
     return passed_values, failed_values
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
@@ -45,11 +46,13 @@ class StartCommandMessages:
         return f"{self.welcome_registered}, {name}!"
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_registration_keyboard() -> InlineKeyboardMarkup:
         """Get inline keyboard for new user registration."""
         return reg_messages.get_start_keyboard()
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_main_menu_keyboard() -> InlineKeyboardMarkup:
         """Get inline keyboard for registered user main menu."""
         return InlineKeyboardMarkup(
@@ -61,6 +64,7 @@ class StartCommandMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_admin_start_menu_keyboard() -> InlineKeyboardMarkup:
         """Get inline keyboard for admin start menu with both admin and user functions."""
         return InlineKeyboardMarkup(
@@ -77,8 +81,12 @@ class StartCommandMessages:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_full_message(base_message: str, additional_info: str = "") -> str:
-        """Combine a base message with additional information."""
+        """Combine a base message with additional information.
+
+        The /start responses combine constant texts, so each pair is built only once.
+        """
         if additional_info:
             return f"{base_message}\n\n{additional_info}"
         return base_message
@@ -1,4 +1,3 @@
-import asyncio
 import dataclasses
 import enum
 
@@ -78,10 +77,10 @@ class StartCommandService:
             Exception: If database operation fails
         """
 
-        logger.debug(f"🔍 Determining user type for telegram_id: {telegram_id}")
+        logger.debug("🔍 Determining user type for telegram_id: {}", telegram_id)
         try:
             if telegram_id in self.admins_ids:
-                logger.info(f"👑 Admin user detected: {telegram_id}")
+                logger.info("👑 Admin user detected: {}", telegram_id)
                 return UserInfo(
                     user_type=UserType.ADMIN,
                     telegram_id=telegram_id,
@@ -89,37 +88,33 @@ class StartCommandService:
                     is_admin=True,
                 )
 
-            banned_user, registered_user, pending_user = await asyncio.gather(
-                self.user_dao.get_banned_user_by_id(telegram_id),
-                self.user_dao.get_registered_user_by_id(telegram_id),
-                self.user_dao.get_pending_user_by_id(telegram_id),
-                return_exceptions=True,
-            )
-            if banned_user and not isinstance(banned_user, Exception):
-                logger.warning(f"🚫 Banned user attempted access: {telegram_id}")
-                return UserInfo(
-                    user_type=UserType.BANNED_USER, telegram_id=telegram_id, user_data=banned_user
-                )
+            # One session cannot run queries concurrently, so the lookups go in priority
+            # order and stop at the first hit; the banned row itself is never needed
+            if await self.user_dao.is_banned_user(telegram_id):
+                logger.warning("🚫 Banned user attempted access: {}", telegram_id)
+                return UserInfo(user_type=UserType.BANNED_USER, telegram_id=telegram_id)
 
-            if registered_user and not isinstance(registered_user, Exception):
-                logger.info(f"✅ Registered user found: {telegram_id}")
+            registered_user = await self.user_dao.get_registered_user_by_id(telegram_id)
+            if registered_user:
+                logger.info("✅ Registered user found: {}", telegram_id)
                 return UserInfo(
                     user_type=UserType.REGISTERED_USER,
                     telegram_id=telegram_id,
                     user_data=registered_user,
                 )
 
-            if pending_user and not isinstance(pending_user, Exception):
-                logger.info(f"⏳ Pending user found: {telegram_id}")
+            pending_user = await self.user_dao.get_pending_user_by_id(telegram_id)
+            if pending_user:
+                logger.info("⏳ Pending user found: {}", telegram_id)
                 return UserInfo(
                     user_type=UserType.PENDING_USER, telegram_id=telegram_id, user_data=pending_user
                 )
 
-            logger.info(f"🆕 New user detected: {telegram_id}")
+            logger.info("🆕 New user detected: {}", telegram_id)
             return UserInfo(user_type=UserType.NEW_USER, telegram_id=telegram_id)
 
         except Exception as e:
-            logger.error(f"❌ Failed to determine user type for {telegram_id}: {e}")
+            logger.error("❌ Failed to determine user type for {}: {}", telegram_id, e)
             raise
 
     async def process_start_command(self, telegram_id: int) -> StartCommandResponse:
@@ -148,7 +143,7 @@ class StartCommandService:
     async def _handle_new_user(user_info: UserInfo) -> StartCommandResponse:
         """Handle a new user."""
 
-        logger.info(f"🎉 Handling new user: {user_info.telegram_id}")
+        logger.info("🎉 Handling new user: {}", user_info.telegram_id)
         return StartCommandResponse(
             action=StartCommandAction.SHOW_REGISTRATION,
             message=messages.welcome_new_user,
@@ -159,7 +154,7 @@ class StartCommandService:
     @staticmethod
     async def _handle_admin(user_info: UserInfo) -> StartCommandResponse:
         """Handle an admin user."""
-        logger.info(f"👑 Handling admin user: {user_info.telegram_id}")
+        logger.info("👑 Handling admin user: {}", user_info.telegram_id)
         return StartCommandResponse(
             action=StartCommandAction.SHOW_ADMIN_PANEL,
             message=messages.welcome_admin,
@@ -171,7 +166,7 @@ class StartCommandService:
     @staticmethod
     async def _handle_registered_user(user_info: UserInfo) -> StartCommandResponse:
         """Handle registered user logic."""
-        logger.info(f"✅ Handling registered user: {user_info.telegram_id}")
+        logger.info("✅ Handling registered user: {}", user_info.telegram_id)
         user_name = user_info.user_data.first_name if user_info.user_data.first_name else ""
         return StartCommandResponse(
             action=StartCommandAction.SHOW_MAIN_MENU,
@@ -184,7 +179,7 @@ class StartCommandService:
     @staticmethod
     async def _handle_pending_user(user_info: UserInfo) -> StartCommandResponse:
         """Handle pending user logic."""
-        logger.info(f"⏳ Handling pending user: {user_info.telegram_id}")
+        logger.info("⏳ Handling pending user: {}", user_info.telegram_id)
         return StartCommandResponse(
             action=StartCommandAction.SHOW_PENDING_STATUS,
             message=messages.pending_status,
@@ -196,7 +191,7 @@ class StartCommandService:
     @staticmethod
     async def _handle_banned_user(user_info: UserInfo) -> StartCommandResponse:
         """Handle banned user logic."""
-        logger.warning(f"🚫 Handling banned user: {user_info.telegram_id}")
+        logger.warning("🚫 Handling banned user: {}", user_info.telegram_id)
         return StartCommandResponse(
             action=StartCommandAction.SHOW_BANNED_MESSAGE,
             message=messages.banned_message,
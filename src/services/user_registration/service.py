@@ -7,6 +7,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.dao.user import UserDAO
 from src.services.user_registration.models import RegistrationData, ValidationResult
 
+_EXISTING_USER_MESSAGES = {
+    "registered": "Пользователь уже зарегистрирован",
+    "pending": "Заявка на регистрацию уже отправлена",
+    "banned": "Пользователь заблокирован",
+}
+
 
 class RegistrationService:
     """Service for handling user registration logic."""
@@ -30,12 +36,15 @@ class RegistrationService:
                 break
         return clean_msg
 
+    @classmethod
     def validate_field(
-        self, field_name: str, value: str, telegram_id: int, username: Optional[str] = None
+        cls, field_name: str, value: str, telegram_id: int, username: Optional[str] = None
     ) -> ValidationResult:
         """
         Validate individual registration field.
 
+        Validation is format-only and needs no database session.
+
         Args:
             field_name: Name of the field to validate
             value: Value to validate
@@ -75,13 +84,13 @@ class RegistrationService:
             field_errors = [error for error in e.errors() if error["loc"] == (field_name,)]
             if field_errors:
                 raw_error_message = field_errors[0]["msg"]
-                clean_error_message = self._extract_clean_error_message(raw_error_message)
+                clean_error_message = cls._extract_clean_error_message(raw_error_message)
             else:
                 clean_error_message = "Ошибка валидации"
             return ValidationResult(is_valid=False, error_message=clean_error_message)
 
         except Exception as e:
-            logger.error(f"❌ Unexpected validation error for {field_name}: {e}")
+            logger.error("❌ Unexpected validation error for {}: {}", field_name, e)
             return ValidationResult(
                 is_valid=False, error_message="Произошла неожиданная ошибка валидации"
             )
@@ -124,7 +133,7 @@ class RegistrationService:
             return False, full_error, None
 
         except Exception as e:
-            logger.error(f"❌ Unexpected error during full validation: {e}")
+            logger.error("❌ Unexpected error during full validation: {}", e)
             return False, "Произошла неожиданная ошибка при валидации данных", None
 
     async def save_registration(self, registration_data: RegistrationData) -> bool:
@@ -141,13 +150,27 @@ class RegistrationService:
             user_input = registration_data.to_user_registration_input()
             await self.user_dao.add_pending_user(user_input)
 
-            logger.info(f"✅ Registration saved for user {registration_data.telegram_id}")
+            logger.info("✅ Registration saved for user {}", registration_data.telegram_id)
             return True
 
         except Exception as e:
-            logger.error(f"❌ Error saving registration for {registration_data.telegram_id}: {e}")
+            logger.error(
+                "❌ Error saving registration for {}: {}", registration_data.telegram_id, e
+            )
             return False
 
+    @staticmethod
+    def describe_existing_user(status: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Convert a status returned by UserDAO.get_existing_user_status to a check result.
+
+        Returns:
+            Tuple of (exists, status_message)
+        """
+        if status is None:
+            return False, None
+        return True, _EXISTING_USER_MESSAGES[status]
+
     async def check_existing_user(self, telegram_id: int) -> Tuple[bool, Optional[str]]:
         """
         Check if user already exists in any table.
@@ -157,23 +180,9 @@ class RegistrationService:
         """
 
         try:
-            # Check if user is already registered
-            registered_user = await self.user_dao.get_registered_user_by_id(telegram_id)
-            if registered_user:
-                return True, "Пользователь уже зарегистрирован"
-
-            # Check if user is already pending
-            pending_user = await self.user_dao.get_pending_user_by_id(telegram_id)
-            if pending_user:
-                return True, "Заявка на регистрацию уже отправлена"
-
-            # Check if user is banned
-            banned_user = await self.user_dao.get_banned_user_by_id(telegram_id)
-            if banned_user:
-                return True, "Пользователь заблокирован"
-
-            return False, None
+            status = await self.user_dao.get_existing_user_status(telegram_id)
+            return self.describe_existing_user(status)
 
         except Exception as e:
-            logger.error(f"❌ Error checking existing user {telegram_id}: {e}")
+            logger.error("❌ Error checking existing user {}: {}", telegram_id, e)
             return True, "Ошибка проверки пользователя"
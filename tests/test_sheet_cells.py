@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+import pytest
+
+from src.schemas.sheet_cells import normalize_size, parse_money
+
+
+def test_parse_money_rounds_to_cents():
+    assert parse_money("12 000,505 ₽") == Decimal("12000.50")
+    assert parse_money("9999999999.994") == Decimal("9999999999.99")
+
+
+@pytest.mark.parametrize("value", ["1e26", "1e30", "1" * 30, "12345678901", "9999999999.995"])
+def test_parse_money_rejects_values_too_large_for_the_column(value):
+    with pytest.raises(ValueError):
+        parse_money(value)
+
+
+@pytest.mark.parametrize("value", ["abc", "NaN", "inf", ""])
+def test_parse_money_rejects_non_numbers(value):
+    with pytest.raises(ValueError):
+        parse_money(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("2,50 Х 03", "2.5x3"), (".5x5.", "0.5x5"), ("5.x3", "5x3"), ("00x0.0", "0x0")],
+)
+def test_normalize_size(value, expected):
+    assert normalize_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["١٢x٣", ".x3", "x3", "2.5.1x3", "2x3x4"])
+def test_normalize_size_rejects_malformed_sizes(value):
+    with pytest.raises(ValueError):
+        normalize_size(value)